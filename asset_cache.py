@@ -0,0 +1,468 @@
+import os
+import math
+import zlib
+import atexit
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Hashable, Iterable
+
+import numpy as np
+import pygame
+
+import assets
+import logs
+
+logger = logs.get_logger(file = __file__) # get logger
+
+# cache key: (path, scale, rotation, flags)
+ImageKey = tuple[str, float | tuple[int, int], float, int]
+# text key: (font, string, fg, bg, antialias)
+TextKey = tuple[pygame.font.Font, str, str | tuple[int, int, int], str | tuple[int, int, int] | None, bool]
+# image to load: (path, scale, rotation)
+ImageSpec = tuple[str, float | tuple[int, int], float]
+
+class TextCache:
+
+	'''
+	Bounded LRU cache of rendered text surfaces.
+
+	A HUD value is only rasterised again when it changes to a string that
+	is not already cached; the least recently used surface is dropped once
+	max_size is reached.
+	'''
+
+	def __init__(self, max_size: int = 256) -> None:
+
+		self.max_size = max_size
+		self.hits = 0
+		self.misses = 0
+		self._surfaces: OrderedDict[TextKey, pygame.surface.Surface] = OrderedDict()
+
+	def __len__(self) -> int:
+		return len(self._surfaces)
+
+	def render(self, font: pygame.font.Font, text: str, antialias: bool, colour: str | tuple[int, int, int], background: str | tuple[int, int, int] | None = None) -> pygame.surface.Surface:
+
+		key: TextKey = (font, text, colour, background, antialias)
+		surface = self._surfaces.get(key)
+
+		if surface is not None:
+
+			self.hits += 1
+			self._surfaces.move_to_end(key)
+			return surface
+
+		self.misses += 1
+		surface = font.render(text, antialias, colour, background)
+		self._surfaces[key] = surface
+		if len(self._surfaces) > self.max_size: self._surfaces.popitem(last = False)
+
+		return surface
+
+	def clear(self) -> None:
+
+		self._surfaces.clear()
+		self.hits = 0
+		self.misses = 0
+
+class RotationTable:
+
+	'''
+	A full turn of pre-rotated frames of one white-on-transparent surface.
+
+	Only each pixel's light is kept - its grey level times its alpha, one
+	byte - cropped to `window` (a rect relative to the surface's centre)
+	and zlib compressed, so a step of a few degrees costs a few MB. Frames
+	are built on a background thread; frame() decodes the one asked for
+	into the alpha of a white surface, which over the dark menu looks as
+	the original does. Until a frame exists the nearest built frame before
+	it is handed out instead, or None if none are built yet. stop() ends a
+	build early - it must not outlive pygame.quit().
+	'''
+
+	FRAMES = 120 # a 3 degree step
+	PALETTE = [(level, level, level) for level in range(256)]
+
+	def __init__(self, source: pygame.surface.Surface, window: pygame.rect.Rect) -> None:
+
+		radius = math.ceil(math.hypot(*source.get_size()) / 2) # no rotation reaches past this
+		self.window = window.clip(pygame.rect.Rect(-radius, -radius, 2 * radius, 2 * radius))
+		self.frame_count = self.FRAMES
+		self.step = 360 / self.frame_count
+		self.frames: list[bytes | None] = [None] * self.frame_count
+		self.ready = False
+
+		# light as an 8 bit greyscale surface; 0 is nothing, so it is what rotation pads with
+		self.source = pygame.surface.Surface(source.get_size(), 0, 8)
+		self.source.set_palette(self.PALETTE)
+		self.source.set_colorkey(0)
+		pygame.surfarray.pixels2d(self.source)[:] = pygame.surfarray.array3d(source).max(axis = 2).astype(np.uint16) * pygame.surfarray.array_alpha(source) // 255
+
+		self._shown: dict[int, pygame.surface.Surface] = {} # the last two frames decoded, oldest first
+
+		self._stopping = threading.Event()
+		self._thread = threading.Thread(target = self._build, name = 'rotation-table', daemon = True)
+		self._thread.start()
+
+	def stop(self) -> None:
+
+		# the frame being built is finished first; a daemon thread still inside SDL at exit dies mid-call
+		self._stopping.set()
+		self._thread.join()
+
+	def _build(self) -> None:
+
+		size = 0 # compressed bytes so far
+
+		for index in range(self.frame_count):
+
+			if self._stopping.is_set(): return
+
+			try:
+
+				rotated = pygame.transform.rotate(self.source, index * self.step)
+				frame = pygame.surface.Surface(self.window.size, 0, 8)
+				frame.set_palette(self.PALETTE)
+				frame.blit(rotated, (-(rotated.get_width() // 2 + self.window.x), -(rotated.get_height() // 2 + self.window.y)))
+				compressed = self.frames[index] = zlib.compress(frame.get_buffer().raw, 1)
+				size += len(compressed)
+
+			except pygame.error as error:
+
+				# pygame was quit under the build without stop() - the frames are of no use now anyway
+				logger.warning(f'rotation table build abandoned: {error}')
+				return
+
+		self.ready = True
+		logger.info(f'rotation table built: {self.frame_count} frames of {self.window.size}, {round(size / 1024 ** 2, 1)} MB compressed')
+
+	def frame(self, angle: float) -> pygame.surface.Surface | None:
+
+		index = round(angle / self.step) % self.frame_count
+
+		while index >= 0:
+
+			compressed = self.frames[index]
+			if compressed is not None: return self._decode(index, compressed)
+			index -= 1
+
+		return None
+
+	def _decode(self, index: int, compressed: bytes) -> pygame.surface.Surface:
+
+		surface = self._shown.pop(index, None)
+
+		if surface is None:
+
+			# reuse the surface shown longest ago - the last one may still be on screen, and a new surface tells the renderer the frame changed
+			if len(self._shown) == 2: surface = self._shown.pop(next(iter(self._shown)))
+
+			else:
+
+				surface = pygame.surface.Surface(self.window.size, pygame.SRCALPHA).convert_alpha()
+				surface.fill((255, 255, 255, 0))
+
+			light = np.frombuffer(zlib.decompress(compressed), dtype = np.uint8).reshape(self.window.height, -1) # rows are padded to the pitch
+			pygame.surfarray.pixels_alpha(surface)[:] = light[:, :self.window.width].T
+
+		self._shown[index] = surface
+		return surface
+
+class AssetCache:
+
+	'''
+	Central registry of decoded + transformed surfaces.
+
+	Every surface is decoded from disk, scaled and rotated exactly once and the
+	same surface object is handed out to every sprite that asks for it, so
+	spawning sprites mid-game never touches the disk.
+	Collision masks and sounds are built once per unique surface / file in
+	the same way. Surfaces handed out are shared - never draw onto them.
+
+	Safe to fill from several threads at once (see AssetLoader): whichever
+	thread asks for an asset first builds it and any other asking meanwhile
+	waits for that build instead of starting its own.
+	'''
+
+	def __init__(self) -> None:
+
+		self._images: dict[ImageKey, pygame.surface.Surface] = {}
+		self.formats: dict[ImageKey, tuple[str, int]] = {} # key -> (blit format, estimated blit cost)
+		self.texts = TextCache()
+		self._masks: dict[pygame.surface.Surface, pygame.mask.Mask] = {}
+		self._sounds: dict[str, pygame.mixer.Sound] = {}
+		self._rotation_tables: dict[tuple[str, float], RotationTable] = {}
+
+		self._lock = threading.Lock()
+		self._building: dict[tuple[int, Hashable], Future] = {} # (id of store, key) -> build in progress
+
+		atexit.register(self.stop_builds) # registered after pygame's own exit handler, so it runs first
+
+	def _once(self, store: dict, key: Hashable, build: Callable[[], Any]) -> Any:
+
+		# store[key], built exactly once whichever thread asks first
+		with self._lock:
+
+			value = store.get(key)
+			if value is not None: return value
+
+			future = self._building.get((id(store), key))
+			owner = future is None
+			if owner: future = self._building[(id(store), key)] = Future()
+
+		if not owner: return future.result()
+
+		try:
+
+			value = store[key] = build()
+			future.set_result(value)
+			return value
+
+		except BaseException as error:
+
+			future.set_exception(error)
+			raise
+
+		finally:
+			with self._lock: del self._building[(id(store), key)]
+
+	def image(self, path: str, scale: float | tuple[int, int] = 1.0, rotation: float = 0.0, flags: int = pygame.SRCALPHA) -> pygame.surface.Surface:
+
+		key: ImageKey = (path, scale, rotation, flags)
+		surface = self._images.get(key)
+		if surface is not None: return surface
+
+		return self._once(self._images, key, lambda: self._build_image(key))
+
+	def _build_image(self, key: ImageKey) -> pygame.surface.Surface:
+
+		path, scale, rotation, flags = key
+
+		if not rotation and scale == 1.0:
+
+			surface = pygame.image.load(assets.resource_path(path))
+			surface = surface.convert_alpha() if flags & pygame.SRCALPHA else surface.convert()
+			logger.info(f'decoded "{path}"')
+
+			return self._optimise(key, surface)
+
+		# variants are made from the analysed original (the scaled one, for a rotation) and inherit its format
+		source_key: ImageKey = (path, scale if rotation else 1.0, 0.0, flags)
+		source = self.image(*source_key)
+		format, cost = self.formats[source_key]
+		visible = cost // 3 if format.startswith('alpha') else cost # drawn pixels, near enough
+
+		if rotation:
+
+			# an opaque image gains transparent corners unless it turns by a right angle
+			if format == 'opaque' and rotation % 90: source, format = source.convert_alpha(), 'alpha'
+			surface = pygame.transform.rotate(source, rotation)
+
+		else:
+
+			if isinstance(scale, tuple): surface = pygame.transform.scale(source, scale)
+			else: surface = pygame.transform.scale_by(source, scale)
+			visible = round(visible * surface.get_width() * surface.get_height() / max(source.get_width() * source.get_height(), 1))
+
+		return self._inherit(key, surface, format, visible)
+
+	def _optimise(self, key: ImageKey, surface: pygame.surface.Surface) -> pygame.surface.Surface:
+
+		'''
+		Pick the cheapest blit format that still looks identical.
+
+		opaque    - every pixel has alpha 255: plain convert(), no blending at all
+		colorkey  - every pixel is either fully transparent or fully opaque: convert() + colorkey, RLE encoded
+		alpha     - real translucency: keep per-pixel alpha (RLE encoded when mostly transparent)
+
+		The estimated cost is in opaque-pixel blits; RLE only pays for the pixels it draws,
+		per-pixel alpha blending costs roughly 3x an opaque copy.
+		'''
+
+		width, height = surface.get_size()
+		area = width * height
+
+		if surface.get_colorkey() is not None:
+			format, cost = 'colorkey', pygame.mask.from_surface(surface).count()
+
+		elif not surface.get_flags() & pygame.SRCALPHA:
+			format, cost = 'opaque', area
+
+		else:
+
+			visible = pygame.mask.from_surface(surface, 0) # alpha > 0
+			opaque = pygame.mask.from_surface(surface, 254) # alpha == 255
+
+			if opaque.count() == area:
+
+				format, cost = 'opaque', area
+				surface = surface.convert()
+
+			elif opaque.count() == visible.count() and (colour_key := self._unused_colour(surface, visible)) is not None:
+
+				format, cost = 'colorkey', visible.count()
+				keyed = pygame.surface.Surface((width, height)).convert()
+				keyed.fill(colour_key)
+				keyed.blit(surface, (0, 0))
+				keyed.set_colorkey(colour_key, pygame.RLEACCEL)
+				surface = keyed
+
+			elif visible.count() < area / 2:
+
+				format, cost = 'alpha (rle)', 3 * visible.count()
+				surface.set_alpha(255, pygame.RLEACCEL)
+
+			else:
+				format, cost = 'alpha', 3 * area
+
+		return self._record(key, surface, format, cost)
+
+	def _inherit(self, key: ImageKey, surface: pygame.surface.Surface, format: str, visible: int) -> pygame.surface.Surface:
+
+		# a transformed copy keeps its source's colour key / alpha but not RLE, which is set again - nothing is re-analysed
+		width, height = surface.get_size()
+		area = width * height
+		if format == 'alpha' and visible < area / 2: format = 'alpha (rle)'
+
+		if format == 'opaque': cost = area
+
+		elif format == 'colorkey':
+
+			surface.set_colorkey(surface.get_colorkey(), pygame.RLEACCEL)
+			cost = visible
+
+		elif format == 'alpha (rle)':
+
+			surface.set_alpha(255, pygame.RLEACCEL)
+			cost = 3 * visible
+
+		else:
+			cost = 3 * area
+
+		return self._record(key, surface, format, cost)
+
+	def _record(self, key: ImageKey, surface: pygame.surface.Surface, format: str, cost: int) -> pygame.surface.Surface:
+
+		width, height = surface.get_size()
+		self.formats[key] = (format, cost)
+		logger.info(f'"{key[0]}" (scale: {key[1]}, rotation: {key[2]}) {width}x{height} -> {format}; est. blit cost {cost} px ({round(cost / max(width * height, 1), 2)}x opaque)')
+
+		return surface
+
+	def _unused_colour(self, surface: pygame.surface.Surface, visible: pygame.mask.Mask) -> tuple[int, int, int] | None:
+
+		# a colour key must not match any pixel that is actually drawn
+		for colour in ((255, 0, 255), (0, 255, 255), (255, 255, 0), (1, 2, 3), (254, 1, 253)):
+
+			matches = pygame.mask.from_threshold(surface, colour, (1, 1, 1, 255))
+			if not visible.overlap_area(matches, (0, 0)): return colour
+
+		return None
+
+	def mask(self, surface: pygame.surface.Surface) -> pygame.mask.Mask:
+
+		# one mask per unique surface; shared surfaces -> shared masks
+		mask = self._masks.get(surface)
+		if mask is not None: return mask
+
+		return self._once(self._masks, surface, lambda: pygame.mask.from_surface(surface))
+
+	def sound(self, path: str) -> pygame.mixer.Sound:
+
+		# one decoded Sound per file; shared, so a volume set on it applies everywhere
+		sound = self._sounds.get(path)
+		if sound is not None: return sound
+
+		return self._once(self._sounds, path, lambda: pygame.mixer.Sound(assets.resource_path(path)))
+
+	def rotation_table(self, path: str, scale: float, window: pygame.rect.Rect) -> RotationTable:
+
+		# one table per image + scale, shared by every sprite showing it - `window` must cover all of them
+		key = (path, scale)
+		table = self._rotation_tables.get(key)
+
+		if table is None:
+			table = self._rotation_tables[key] = RotationTable(self.image(path, scale), window)
+
+		return table
+
+	def stop_builds(self) -> None:
+
+		# before pygame.quit(): no background build may still be calling into SDL
+		for table in self._rotation_tables.values(): table.stop()
+
+	def text(self, font: pygame.font.Font, text: str, antialias: bool, colour: str | tuple[int, int, int], background: str | tuple[int, int, int] | None = None) -> pygame.surface.Surface:
+
+		return self.texts.render(font, text, antialias, colour, background)
+
+	def preload(self, images: list[tuple[str, float | tuple[int, int], float]]) -> None:
+
+		for path, scale, rotation in images: self.mask(self.image(path, scale, rotation))
+		logger.info(f'preloaded {len(images)} images ({len(self._images)} cached surfaces)')
+
+class AssetLoader:
+
+	'''
+	Fills an AssetCache on a pool of worker threads.
+
+	Decoding, scaling, mask building and audio decoding all release the GIL
+	inside SDL, so the workers really do run side by side while the main
+	thread keeps the window alive. Everything goes through the cache, so
+	an asset the main thread asks for while a worker is still building it
+	is waited for - never built twice.
+	'''
+
+	def __init__(self, cache: AssetCache, workers: int | None = None) -> None:
+
+		self.cache = cache
+		self.futures: list[Future] = []
+		self._executor = ThreadPoolExecutor(max_workers = workers or min(8, os.cpu_count() or 1), thread_name_prefix = 'asset-loader')
+
+	def images(self, images: Iterable[ImageSpec], masks: bool = False) -> list[Future]:
+
+		# variants of the same file go to one worker in order, so the decoded original is shared, not raced for
+		by_path: dict[str, list[ImageSpec]] = {}
+		for image in images: by_path.setdefault(image[0], []).append(image)
+
+		def load(specs: list[ImageSpec]) -> None:
+
+			for path, scale, rotation in specs:
+
+				surface = self.cache.image(path, scale, rotation)
+				if masks: self.cache.mask(surface)
+
+		return self._submit([(load, specs) for specs in by_path.values()])
+
+	def sounds(self, paths: Iterable[str]) -> list[Future]:
+		return self._submit([(self.cache.sound, path) for path in paths])
+
+	def _submit(self, jobs: list[tuple[Callable, Any]]) -> list[Future]:
+
+		futures = [self._executor.submit(job, argument) for job, argument in jobs]
+		self.futures += futures
+		return futures
+
+	@ property
+	def progress(self) -> float:
+
+		# fraction of every job submitted so far that has finished
+		if not self.futures: return 1.0
+		return sum(future.done() for future in self.futures) / len(self.futures)
+
+	def wait(self, futures: list[Future], on_progress: Callable[[float], None], interval: float = 1 / 30) -> None:
+
+		# blocks until `futures` are done, calling on_progress(progress) every interval meanwhile; re-raises any failure
+		pending = set(futures)
+
+		while pending:
+
+			_, pending = wait(pending, timeout = interval)
+			on_progress(self.progress)
+
+		for future in futures: future.result()
+
+	def shutdown(self) -> None:
+
+		# queued jobs still run; nothing waits for them
+		self._executor.shutdown(wait = False)
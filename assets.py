@@ -14,11 +14,13 @@ WORKING_DIR = os.path.dirname(__file__) # exe: _internal
 FILE_NAMES = {
 	'config': 'config.toml',
 	'user_data': 'user_data.toml',
+	'replay': 'last_round.replay'
 }
 # save data
 SAVE_DIR = '' if EXE else os.path.join(WORKING_DIR, 'save_data\\')
 CONFIG_PATH = os.path.join(WORKING_DIR, '..' if EXE else SAVE_DIR, FILE_NAMES['config'])
 USER_DATA_PATH = os.path.join(WORKING_DIR, '' if EXE else SAVE_DIR, FILE_NAMES['user_data'])
+REPLAY_PATH = os.path.join(WORKING_DIR, '' if EXE else SAVE_DIR, FILE_NAMES['replay'])
 # logs
 LOGS_DIR = os.path.join(WORKING_DIR, '..' if EXE else '', 'logs\\')
 
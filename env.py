@@ -0,0 +1,344 @@
+import atexit
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Literal, TypedDict
+
+import numpy as np
+import pygame
+
+import headless
+import logs
+import main
+import pixels
+import workers
+
+logger = logs.get_logger(file = __file__) # get logger
+
+RenderMode = Literal['human', 'rgb_array'] | None
+
+# what every observation holds, in order - positions are scaled to the screen, speeds + energy to their limits
+OBSERVATION_FIELDS = (
+	'y', # player centre
+	'y_vel',
+	'chilli_energy',
+	'next_gap_dx', # left edge of the next fork pair, from the player's left edge
+	'next_gap_dy', # centre of its gap, from the player's centre
+	'following_gap_dx', # the pair after it
+	'following_gap_dy'
+)
+
+class EnvInfoDict(TypedDict):
+	seed: int
+	ticks: int
+	score: int
+	chillies: int
+	death_cause: str
+	truncated: bool
+
+class TacoEnv:
+
+	'''
+	Step / reset wrapper around one headless Game, in the style of a Gym env.
+
+	Each step() is one fixed simulation tick with the jump button held
+	(action 1) or released (action 0), and returns (observation, reward,
+	done, info). The reward is POINT_REWARD per Game.point and
+	CHILLI_REWARD per Game.chilli_collected on that tick. A round is done
+	when the taco dies or after max_ticks, which info['truncated'] tells
+	apart.
+
+	Observations are the OBSERVATION_FIELDS vector, or with `pixel_size` set a
+	stack of the last `frame_stack` frames drawn at that (width, height) by
+	a PixelRenderer - greyscale (frame_stack, h, w) or colour
+	(frame_stack, h, w, 3) uint8. The stack is a view that the next step
+	overwrites.
+	'''
+
+	POINT_REWARD = 1.0
+	CHILLI_REWARD = 0.1
+
+	def __init__(
+		self, max_ticks: int = 120 * main.Game.TICK_RATE, render_mode: RenderMode = None, user_data: main.file_config.UserDataDict | None = None,
+		pixel_size: tuple[int, int] | None = None, grayscale: bool = True, frame_stack: int = 1, hud: bool = False
+	) -> None:
+
+		# headless picks SDL's dummy video driver unless one was set before env was imported - nothing would ever be seen
+		if render_mode == 'human' and pygame.display.get_driver() == 'dummy':
+			raise RuntimeError("render_mode 'human' needs a real window; set SDL_VIDEODRIVER (e.g. x11, wayland, windows, cocoa) before importing env")
+
+		self.engine = headless.HeadlessEngine(pilot = lambda game: self.action, user_data = user_data)
+		self.game = self.engine.game
+		self.max_ticks = max_ticks
+		self.render_mode = render_mode
+		self.action = False
+		self.ticks = 0
+
+		# pixel observations - hud draws the score + energy text into them too
+		self.hud = hud
+		self.pixel_renderer: pixels.PixelRenderer | None = None
+		self.frames: pixels.FrameStack | None = None
+		self.observation_shape: tuple[int, ...] = (len(OBSERVATION_FIELDS),)
+
+		if pixel_size:
+
+			self.pixel_renderer = pixels.PixelRenderer(size = pixel_size, source_size = (main.WIDTH, main.HEIGHT), grayscale = grayscale, fill_colour = main.COLOURS['black'])
+			self.frames = pixels.FrameStack(frame_stack, self.pixel_renderer.shape)
+			self.observation_shape = self.pixel_renderer.shape if frame_stack == 1 else (frame_stack, *self.pixel_renderer.shape)
+
+	def reset(self, seed: int | None = None) -> np.ndarray:
+
+		self.game.restart(seed)
+		self.game.start()
+		self.action = False
+		self.ticks = 0
+
+		return self.observation(first = True)
+
+	def step(self, action: int | bool) -> tuple[np.ndarray, float, bool, EnvInfoDict]:
+
+		game = self.game
+		if game.state != game.STATES['play']: raise RuntimeError('step() called on a finished round; call reset() first')
+
+		score, chillies = game.score, game.chillies_collected
+		self.action = bool(action)
+
+		game.step(game.TICK)
+		self.ticks += 1
+
+		reward = (game.score - score) * self.POINT_REWARD + (game.chillies_collected - chillies) * self.CHILLI_REWARD
+		over = game.state == game.STATES['over']
+		truncated = not over and self.ticks >= self.max_ticks
+
+		if self.render_mode == 'human': self.render()
+
+		return self.observation(), reward, over or truncated, self.info(truncated)
+
+	def observation(self, first: bool = False) -> np.ndarray:
+
+		if self.frames: return self.pixel_observation(first)
+
+		game = self.game
+		player = game.player.sprite
+		obstacles = game.world
+		observation = np.empty(len(OBSERVATION_FIELDS), dtype = np.float32)
+
+		observation[0] = player.pos.y / main.HEIGHT
+		observation[1] = player.y_vel / player.JUMP_BOOST
+		observation[2] = player.chilli_energy / player.MAX_CHILLI_ENERGY
+
+		# the next two fork pairs; past the last one the gap is a screen away, level with the centre
+		index = obstacles.next_column(player.rect.left)
+
+		for slot in (3, 5):
+
+			if index != -1 and index < obstacles.count:
+
+				observation[slot] = (obstacles.x[index] - player.rect.left) / main.WIDTH
+				observation[slot + 1] = (obstacles.y[index] - player.pos.y) / main.HEIGHT
+				index += 1
+
+			else:
+
+				observation[slot] = 1.0
+				observation[slot + 1] = (main.CENTRE_Y - player.pos.y) / main.HEIGHT
+				index = -1
+
+		return observation
+
+	def pixel_observation(self, first: bool = False) -> np.ndarray:
+
+		# draws the low-res frame and files it in the stack; the surface view is let go of straight away
+		assert self.pixel_renderer and self.frames
+		game = self.game
+		game.interpolate(1.0)
+		if self.hud: game.text.update()
+
+		self.pixel_renderer.render((game.background, game.forks, game.chillies, game.player), game.text.texts if self.hud else ())
+		frame = self.pixel_renderer.pixels()
+
+		if first: self.frames.reset(frame)
+		else: self.frames.push(frame)
+		del frame
+
+		stacked = self.frames.stacked()
+		return stacked[0] if self.frames.depth == 1 else stacked
+
+	def info(self, truncated: bool = False) -> EnvInfoDict:
+
+		game = self.game
+
+		return {
+			'seed': game.seed,
+			'ticks': self.ticks,
+			'score': game.score,
+			'chillies': game.chillies_collected,
+			'death_cause': game.player.sprite.death_cause if game.state == game.STATES['over'] else '',
+			'truncated': truncated
+		}
+
+	def draw(self, surface: pygame.surface.Surface) -> None:
+
+		# the play scene as main() draws it, at the last tick's positions
+		game = self.game
+		game.interpolate(1.0)
+		game.text.update()
+
+		surface.fill(main.COLOURS['black'])
+		for group in (game.background, game.forks, game.chillies, game.player): group.draw(surface)
+		for text_surface, rect in game.text.texts: surface.blit(text_surface, rect)
+
+	def render(self) -> np.ndarray | None:
+
+		# 'human' draws to the window; 'rgb_array' returns the frame as a (height, width, 3) array
+		if self.render_mode is None: return None
+
+		self.draw(main.screen)
+
+		if self.render_mode == 'human':
+
+			pygame.event.pump() # keeps the window responsive; render() is all that runs between steps
+			pygame.display.flip()
+			return None
+
+		return pygame.surfarray.array3d(main.screen).swapaxes(0, 1)
+
+	def close(self) -> None:
+		self.game.stop_recording()
+
+def _vector_worker(connection: Connection, count: int, options: dict) -> None:
+
+	# hosts a slice of a VectorEnv's envs in its own process; answers one command at a time until 'close'
+	workers.ignore_interrupts()
+	envs = VectorEnv(count, **options)
+
+	while True:
+
+		# a parent gone without saying 'close' leaves the pipe closed - never outlive it
+		try: command, data = connection.recv()
+		except (EOFError, OSError): break
+
+		if command == 'reset': connection.send(envs.reset(data))
+		elif command == 'step': connection.send(envs.step(data))
+		elif command == 'close': break
+
+	envs.close()
+	connection.close()
+
+class VectorEnv:
+
+	'''
+	Steps `count` TacoEnvs in lock-step, batched.
+
+	reset() and step() take and return arrays with one row per env. An env
+	whose round ends is reset on the spot, so every row of the next step is
+	a live round; its step's info keeps the finished round's info and adds
+	the final observation under 'final_observation'. Env i of a reset with
+	a seed flies seed + i.
+
+	With processes > 0 the envs are split over that many worker processes,
+	each stepping its slice while the others step theirs. Otherwise every
+	env lives in this process. Any other keyword arguments are passed to
+	every TacoEnv.
+	'''
+
+	def __init__(self, count: int, processes: int = 0, **options) -> None:
+
+		self.count = count
+		self.processes = min(processes, count)
+		self.envs: list[TacoEnv] = []
+		self.connections: list[Connection] = []
+		self.workers: list[BaseProcess] = []
+		self.slices: list[int] = []
+
+		if not self.processes:
+
+			self.envs = [TacoEnv(**options) for _ in range(count)]
+			return
+
+		context = workers.context()
+		self.slices = [len(part) for part in np.array_split(np.arange(count), self.processes)]
+
+		for size in self.slices:
+
+			connection, child = context.Pipe()
+			worker = context.Process(target = _vector_worker, args = (child, size, options), daemon = True)
+			worker.start()
+			child.close()
+
+			self.connections.append(connection)
+			self.workers.append(worker)
+
+		# multiprocessing's own exit handler would terminate() + join the workers, and they outlive a SIGTERM;
+		# registered after it, this runs first
+		atexit.register(self.close)
+		logger.info(f'vector env of {count} envs started over {self.processes} processes')
+
+	def reset(self, seed: int | None = None) -> np.ndarray:
+
+		if self.connections:
+
+			offset = 0
+
+			for connection, size in zip(self.connections, self.slices):
+
+				connection.send(('reset', None if seed is None else seed + offset))
+				offset += size
+
+			return np.concatenate([connection.recv() for connection in self.connections])
+
+		return np.stack([env.reset(None if seed is None else seed + index) for index, env in enumerate(self.envs)])
+
+	def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[dict]]:
+
+		if self.connections:
+
+			# every worker steps its slice before any answer is waited on
+			offset = 0
+
+			for connection, size in zip(self.connections, self.slices):
+
+				connection.send(('step', actions[offset:offset + size]))
+				offset += size
+
+			results = [connection.recv() for connection in self.connections]
+
+			return (
+				np.concatenate([result[0] for result in results]),
+				np.concatenate([result[1] for result in results]),
+				np.concatenate([result[2] for result in results]),
+				[info for result in results for info in result[3]]
+			)
+
+		observations = []
+		rewards = np.empty(self.count, dtype = np.float64)
+		dones = np.empty(self.count, dtype = np.bool_)
+		infos: list[dict] = []
+
+		for index, (env, action) in enumerate(zip(self.envs, actions)):
+
+			observation, rewards[index], dones[index], info = env.step(action)
+
+			if dones[index]:
+
+				info = {**info, 'final_observation': observation.copy()} # the reset below writes over a pixel stack
+				observation = env.reset()
+
+			observations.append(observation)
+			infos.append(info)
+
+		return np.stack(observations), rewards, dones, infos
+
+	def close(self) -> None:
+
+		for env in self.envs: env.close()
+
+		workers.close_processes(self.connections, self.workers)
+		self.connections = []
+		self.workers = []
+		atexit.unregister(self.close)
+
+	def __enter__(self) -> 'VectorEnv':
+		return self
+
+	def __exit__(self, *_) -> None:
+		self.close()
@@ -0,0 +1,166 @@
+import os
+import sys
+import argparse
+from time import perf_counter
+from typing import Callable, Iterable, TypedDict
+
+# SDL must pick its dummy drivers before main.py initialises pygame + opens the window - unless the caller
+# already chose real ones (a TacoEnv rendering to a window needs them)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+import logs
+import main
+import replay
+
+logger = logs.get_logger(file = __file__) # get logger
+
+# Pilots - decide whether to hold jump on this tick
+Pilot = Callable[[main.Game], bool]
+
+class RoundResultDict(TypedDict):
+	seed: int
+	score: int
+	ticks: int
+	survival_time: float
+	chillies: int
+	death_cause: str
+
+def heuristic_pilot(game: main.Game) -> bool:
+
+	# hold jump while below the next gap's centre and falling
+	player = game.player.sprite
+	target = game.next_gap()
+	if target is None: target = main.CENTRE_Y
+
+	return player.pos.y > target + 30 and player.y_vel > 0
+
+class ScriptedPilot:
+
+	'''Presses jump on exactly the given ticks of a round (tick 0 = first tick after start).'''
+
+	def __init__(self, ticks: Iterable[int]) -> None:
+
+		self.ticks = set(ticks)
+		self.tick = 0
+
+	def __call__(self, game: main.Game) -> bool:
+
+		pressed = self.tick in self.ticks
+		self.tick += 1
+		return pressed
+
+class ReplayPilot:
+
+	'''Feeds a recorded round's inputs back one tick at a time; never jumps once they run out.'''
+
+	def __init__(self, reader: replay.ReplayReader) -> None:
+		self.inputs = iter(reader)
+
+	def __call__(self, game: main.Game) -> bool:
+		return next(self.inputs, False)
+
+class HeadlessEngine:
+
+	'''
+	Runs the play simulation with no window, audio, blits or frame limiter.
+
+	Rounds are stepped tick by tick with the same rules as main(), as fast as
+	the CPU allows. The game is a lean one - no music, menus or menu artwork
+	are built - unless presentation is set.
+	'''
+
+	def __init__(self, pilot: Pilot = heuristic_pilot, user_data: main.file_config.UserDataDict | None = None, presentation: bool = False) -> None:
+
+		self.game = main.Game(user_data = user_data or {'high_score': 0, 'costume_index': 0}, presentation = presentation)
+		self.pilot = pilot
+
+		# music + recording every round have no place in a headless run
+		pygame.mixer.stop()
+		self.game.replay_path = None
+
+		self.game.player.sprite.controller = lambda: self.pilot(self.game)
+
+	def run_round(self, max_ticks: int = 120 * main.Game.TICK_RATE, seed: int | None = None, record: str | None = None) -> RoundResultDict:
+
+		# record: path to write this round's replay to
+		game = self.game
+		game.replay_path = record
+		game.restart(seed)
+		game.start()
+
+		ticks = 0
+
+		while game.state == game.STATES['play'] and ticks < max_ticks:
+
+			game.step(game.TICK)
+			ticks += 1
+
+		game.stop_recording() # a round cut off at max_ticks never reaches handle_game_over
+		game.replay_path = None
+
+		return {
+			'seed': game.seed,
+			'score': game.score,
+			'ticks': ticks,
+			'survival_time': ticks * game.TICK,
+			'chillies': game.chillies_collected,
+			'death_cause': game.player.sprite.death_cause if game.state == game.STATES['over'] else ''
+		}
+
+	def run(self, rounds: int, max_ticks: int = 120 * main.Game.TICK_RATE) -> list[RoundResultDict]:
+		return [self.run_round(max_ticks) for _ in range(rounds)]
+
+	def replay(self, path: str) -> RoundResultDict:
+
+		# plays a recorded round back through the same simulation; the same seed + inputs -> the same round
+		with replay.ReplayReader.open(path) as reader:
+
+			header = reader.header
+			if header['tick_rate'] != main.Game.TICK_RATE: raise ValueError(f'replay recorded at {header["tick_rate"]} ticks/s; the simulation runs at {main.Game.TICK_RATE}')
+
+			self.game.player.sprite.image_index = header['costume_index']
+			pilot, self.pilot = self.pilot, ReplayPilot(reader)
+
+			try: return self.run_round(max_ticks = header['ticks'] or sys.maxsize, seed = header['seed'])
+			finally: self.pilot = pilot
+
+def init() -> None:
+
+	parser = argparse.ArgumentParser(description = 'Run Flappy Taco rounds headless, as fast as possible.')
+	parser.add_argument('--rounds', type = int, default = 100)
+	parser.add_argument('--max-seconds', type = float, default = 120.0, help = 'simulated seconds before a round is cut off')
+	parser.add_argument('--seed', type = int, help = 'seed of the first round; each following round uses the next seed')
+	parser.add_argument('--record', metavar = 'PATH', help = 'record the first round to a replay file')
+	parser.add_argument('--replay', metavar = 'PATH', help = 'play a replay file back instead of flying rounds')
+	args = parser.parse_args()
+
+	engine = HeadlessEngine()
+
+	if args.replay:
+
+		result = engine.replay(args.replay)
+		summary = f'replay of seed {result["seed"]}: score {result["score"]}, {result["ticks"]} ticks ({round(result["survival_time"], 2)}s), {result["chillies"]} chillies, {result["death_cause"] or "survived"}'
+
+		logger.info(summary)
+		print(summary)
+		return
+
+	max_ticks = round(args.max_seconds * main.Game.TICK_RATE)
+	start_time = perf_counter()
+	results = [
+		engine.run_round(max_ticks, seed = None if args.seed is None else args.seed + index, record = args.record if index == 0 else None) 
+		for index in range(args.rounds)
+	]
+	elapsed = perf_counter() - start_time
+
+	scores = [result['score'] for result in results]
+	survival = [result['survival_time'] for result in results]
+	summary = f'{args.rounds} rounds in {round(elapsed, 2)}s ({round(args.rounds / elapsed * 60)} rounds/min); mean score {round(sum(scores) / len(scores), 2)}, max score {max(scores)}, mean survival {round(sum(survival) / len(survival), 2)}s'
+
+	logger.info(summary)
+	print(summary)
+
+if __name__ == '__main__': init()
@@ -1,11 +1,19 @@
-from random import randint
-from time import time
-from typing import TypedDict, Literal
+import random
+from concurrent.futures import Future
+from time import perf_counter
+from typing import Callable, NotRequired, TypedDict, Literal
 
+import numpy as np
 import pygame
 
 import assets
+import asset_cache
 import logs
+import pool
+import rendering
+import replay
+import spawner
+import world
 # import update
 import file_config
 
@@ -38,6 +46,9 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED if VSYNC else 0,
 clock = pygame.time.Clock()
 logger.info('pygame initialised: screen and clock objects created')
 
+# Asset Cache
+cache = asset_cache.AssetCache()
+
 # Window Setup
 icon = pygame.image.load(assets.resource_path('images/icon.ico')).convert_alpha()
 splashscreen = pygame.image.load(assets.resource_path('images/splashscreen.png')).convert_alpha()
@@ -48,6 +59,19 @@ pygame.display.set_caption('Flappy Taco | INITIALISING...')
 screen.blit(splashscreen, splashscreen.get_rect(center = (CENTRE_X, CENTRE_Y)))
 pygame.display.update()
 
+def show_loading_progress(progress: float) -> None:
+
+	# a bar under the splash while assets load; pumping events keeps the window responsive
+	pygame.event.pump()
+	bar = pygame.rect.Rect(0, 0, WIDTH // 3, 10)
+	bar.midbottom = (CENTRE_X, HEIGHT - 30)
+
+	pygame.draw.rect(screen, COLOURS['black'], bar)
+	pygame.draw.rect(screen, COLOURS['light_yellow'], (bar.x, bar.y, round(bar.width * progress), bar.height))
+	pygame.draw.rect(screen, COLOURS['white'], bar, width = 1)
+	pygame.display.update(bar)
+	pygame.display.set_caption(f'Flappy Taco | LOADING {round(progress * 100)}%')
+
 # Fonts
 main_font = pygame.font.Font(assets.resource_path('fonts/slkscrb.ttf'), size = 50)
 secondary_font = pygame.font.Font(assets.resource_path('fonts/slkscr.ttf'), size = 30)
@@ -66,8 +90,8 @@ class ButtonSFXDict(TypedDict):
 	click: pygame.mixer.Sound
 
 class SFXDict(TypedDict):
-	chilli: ChilliSFXDict
-	player: PlayerSFXDict
+	chilli: NotRequired[ChilliSFXDict] # with the play scene
+	player: NotRequired[PlayerSFXDict]
 	button: ButtonSFXDict
 
 # Game States
@@ -78,6 +102,20 @@ class GameStatesDict(TypedDict):
 	play: Literal[3]
 	over: Literal[4]
 
+# Obstacles
+class ColumnDict(TypedDict):
+	y_offset: int
+	chilli: bool
+
+# Snapshots
+class SnapshotDict(TypedDict):
+	scalars: np.ndarray # Game.SNAPSHOT_FIELDS, in order
+	columns: np.ndarray # ObstacleWorld.snapshot()
+	background: np.ndarray # (x, previous x) of each background sprite
+	upcoming: tuple[ColumnDict, ...] # the spawner's queue
+	rng: tuple
+	death_cause: str
+
 # Sprites
 class Game:
 
@@ -92,38 +130,58 @@ class Game:
 	# Fork Settings
 	_FORK_SPEED = 400
 	_FORK_COUNT = 5
-	_FORK_FREQUENCY = 1000
-	# Timers
+	_FORK_FREQUENCY = 1000 # ms of scrolling between fork columns
 	CHILLI_FREQUENCY = 1
-	FORK_TIMER = pygame.USEREVENT + 1
-
-	def __init__(self, user_data: file_config.UserDataDict) -> None:
+	# Simulation - fixed ticks, independent of the frame rate
+	TICK_RATE = 120
+	TICK = 1 / TICK_RATE
+	MAX_CATCH_UP_TICKS = 12 # past this the simulation slows down rather than spiralling
+	SWEEP_STEP = 4 # px of relative movement between swept collision samples - well under a tine's width
+	RAYS_POS = {'menu': (CENTRE_X + 150, CENTRE_Y + 215), 'choose_taco': (CENTRE_X, CENTRE_Y + 10)} # god rays centre in each scene showing them
+	# Snapshots - every scalar of the round's state, packed into one array
+	SNAPSHOT_FIELDS = ('state', 'started', 'paused', 'score', 'chillies_collected', 'seed', 'y', 'previous_y', 'y_vel', 'chilli_energy', 'jumping', 'until_next', 'scrolled')
+
+	def __init__(self, user_data: file_config.UserDataDict, presentation: bool = True) -> None:
 		
+		# a lean game (presentation False) is only ever stepped + drawn in play - no music, menus or menu artwork
+		self.presentation = presentation
 		self._state: Literal[0, 1, 2, 3, 4] = self.STATES['menu']
 		self._started = False
 		self._paused = False
-		self.score = 0
-		self.high_score: int = user_data['high_score']
+		self._score = 0
+		self._high_score: int = user_data['high_score']
+		self.chillies_collected = 0
+
+		# every round is driven by its own seeded rng, and its input recorded, so it can be replayed exactly
+		self.rng = random.Random()
+		self._rng_state: tuple | None = None # rng.getstate() since the rng was last drawn from - snapshots between spawns share it
+		self.seed = 0
+		self.replay_path: str | None = assets.REPLAY_PATH
+		self.recorder: replay.ReplayWriter | None = None
 
 		# Audio
-		self._MUSIC = pygame.mixer.Sound(assets.resource_path('audio/music/raining-tacos.mp3'))
-		self._MUSIC.set_volume(VOLUMES['music'])
+		self._MUSIC: pygame.mixer.Sound | None = cache.sound('audio/music/raining-tacos.mp3') if presentation else None
+		if self._MUSIC: self._MUSIC.set_volume(VOLUMES['music'])
 
+		# the play sounds join with the play scene
 		self.SFX: SFXDict = {
-			'chilli': {
-				'collect': pygame.mixer.Sound(assets.resource_path('audio/sfx/chilli/collect.mp3')),
-			},
-			'player': {
-				'death': pygame.mixer.Sound(assets.resource_path('audio/sfx/player/death.mp3')),
-				'jump': pygame.mixer.Sound(assets.resource_path('audio/sfx/player/jump.wav'))
-			},
 			'button': {
-				'click': pygame.mixer.Sound(assets.resource_path('audio/sfx/button/click.wav'))
+				'click': cache.sound('audio/sfx/button/click.wav')
 			}
 		}
 		
 		logger.info('audio initialised')
 
+		# columns are spawned by distance scrolled, so spacing is exact at any frame rate
+		self.spawner: spawner.SpawnScheduler[ColumnDict] = spawner.SpawnScheduler(
+			spacing = self.fork_spacing,
+			generate = self.generate_column
+		)
+
+		# obstacle sprites are recycled through pools, never rebuilt mid-game
+		self.fork_pair_pool: pool.Pool[ForkPair] = pool.Pool(ForkPair, name = 'fork pair')
+		self.chilli_pool: pool.Pool[Chilli] = pool.Pool(lambda: Chilli(game = self), name = 'chilli')
+
 		self.text = Text(self)
 		self.player = pygame.sprite.GroupSingle(Player(game = self, user_data = user_data))
 		self.forks: pygame.sprite.Group = pygame.sprite.Group()
@@ -132,35 +190,22 @@ class Game:
 			Background(CENTRE_X), 
 			Background(CENTRE_X + WIDTH)
 		)
-		self.menu_sprites = pygame.sprite.Group(
-			IntroSprite(type = 'rays', pos = (CENTRE_X + 150, CENTRE_Y + 215), game = self),
-			IntroSprite(type = 'taco', pos = (CENTRE_X + 150, CENTRE_Y + 225), game = self),
-			Button(type = 'play', pos = (120, CENTRE_Y + 120), animation_type = 'slide', animation_offset = 25, press_state = self.STATES['play'], game = self),
-			Button(type = 'help', pos = (WIDTH - 85, HEIGHT - 100), animation_type = 'float', animation_offset = 0.2, press_state = self.STATES['help'], game = self),
-			Button(type = 'choose-taco', pos = (147, HEIGHT - 100), animation_type = 'slide', animation_offset = 25, press_state = self.STATES['choose_taco'], game = self)
-		)
-		self.choose_taco_sprites = pygame.sprite.Group(
-			IntroSprite(type = 'rays', pos = (CENTRE_X, CENTRE_Y + 10), game = self),
-			Button(type = 'ok!', pos = (CENTRE_X, CENTRE_Y + 250), animation_type = 'float', animation_offset = 0.2, press_state = self.STATES['menu'], game = self),
-			Button(type = 'arrow-left', pos = (CENTRE_X - 300, CENTRE_Y), animation_type = 'float', animation_offset = 0.4, press_state = 'last-costume', game = self),
-			Button(type = 'arrow-right', pos = (CENTRE_X + 300, CENTRE_Y), animation_type = 'float', animation_offset = 0.4, press_state = 'next-costume', game = self)
-		)
-		self.game_over_sprites = pygame.sprite.Group(
-			MenuBackground(pos = (CENTRE_X, 0), offset = HEIGHT // 2),
-			Button(type = 'try-again', pos = (CENTRE_X, CENTRE_Y + 60), animation_type = 'float', animation_offset = 0.2, press_state = self.STATES['play'], game = self),
-			Button(type = 'main-menu', pos = (CENTRE_X, CENTRE_Y + 160), animation_type = 'float', animation_offset = 0.2, press_state = self.STATES['menu'], game = self)
-		)
-		self.pause_sprites = pygame.sprite.Group(
-			MenuBackground(pos = (CENTRE_X, 0), offset = HEIGHT // 2),
-			Button(type = 'resume', pos = (CENTRE_X, CENTRE_Y + 50), animation_type = 'float', animation_offset = 0.2, press_state = 'unpause', game = self),
-			Button(type = 'main-menu', pos = (CENTRE_X, CENTRE_Y + 150), animation_type = 'float', animation_offset = 0.2, press_state = self.STATES['menu'], game = self)
-		)
-		logger.info('sprites inititalised')
+		# menu scenes - empty in a lean game
+		self.menu_sprites: pygame.sprite.Group = pygame.sprite.Group()
+		self.choose_taco_sprites: pygame.sprite.Group = pygame.sprite.Group()
+		self.game_over_sprites: pygame.sprite.Group = pygame.sprite.Group()
+		self.pause_sprites: pygame.sprite.Group = pygame.sprite.Group()
+
+		# both scenes' god rays share one rotation table, cropped to what either can show
+		self.rays_window = IntroSprite.visible_window(self.RAYS_POS['menu']).union(IntroSprite.visible_window(self.RAYS_POS['choose_taco']))
 
-		# Timers
-		pygame.time.set_timer(self.FORK_TIMER, self._FORK_FREQUENCY)
+		# each scene is built the first time it is entered - starting up only waits on the menu's assets
+		self._scenes: set[str] = set()
+		self.enter('menu' if presentation else 'play')
+
+		logger.info('sprites inititalised')
 
-		self._MUSIC.play(loops = -1)
+		if self._MUSIC: self._MUSIC.play(loops = -1)
 	
 	@ property
 	def paused(self) -> bool:
@@ -176,34 +221,322 @@ class Game:
 
 	@ state.setter
 	def state(self, state: Literal[0, 1, 2, 3, 4]) -> None:
-		self._state = self.STATES[('menu', 'help', 'choose_taco', 'play', 'over')[state]]
+		name = ('menu', 'help', 'choose_taco', 'play', 'over')[state]
+		self.enter(name)
+		self._state = self.STATES[name]
+
+	def enter(self, scene: str) -> None:
+
+		if scene in self._scenes: return
+		self._scenes.add(scene)
+
+		if scene == 'play': self.build_play()
+		if not self.presentation: return
+
+		match scene:
+
+			case 'menu':
+				self.menu_sprites.add(
+					IntroSprite(type = 'rays', pos = self.RAYS_POS['menu'], game = self),
+					IntroSprite(type = 'taco', pos = (CENTRE_X + 150, CENTRE_Y + 225), game = self),
+					Button(type = 'play', pos = (120, CENTRE_Y + 120), animation_type = 'slide', animation_offset = 25, press_state = self.STATES['play'], game = self),
+					Button(type = 'help', pos = (WIDTH - 85, HEIGHT - 100), animation_type = 'float', animation_offset = 0.2, press_state = self.STATES['help'], game = self),
+					Button(type = 'choose-taco', pos = (147, HEIGHT - 100), animation_type = 'slide', animation_offset = 25, press_state = self.STATES['choose_taco'], game = self)
+				)
+
+			case 'choose_taco':
+				self.choose_taco_sprites.add(
+					IntroSprite(type = 'rays', pos = self.RAYS_POS['choose_taco'], game = self),
+					Button(type = 'ok!', pos = (CENTRE_X, CENTRE_Y + 250), animation_type = 'float', animation_offset = 0.2, press_state = self.STATES['menu'], game = self),
+					Button(type = 'arrow-left', pos = (CENTRE_X - 300, CENTRE_Y), animation_type = 'float', animation_offset = 0.4, press_state = 'last-costume', game = self),
+					Button(type = 'arrow-right', pos = (CENTRE_X + 300, CENTRE_Y), animation_type = 'float', animation_offset = 0.4, press_state = 'next-costume', game = self)
+				)
+
+			case 'play':
+				self.pause_sprites.add(
+					MenuBackground(pos = (CENTRE_X, 0), offset = HEIGHT // 2),
+					Button(type = 'resume', pos = (CENTRE_X, CENTRE_Y + 50), animation_type = 'float', animation_offset = 0.2, press_state = 'unpause', game = self),
+					Button(type = 'main-menu', pos = (CENTRE_X, CENTRE_Y + 150), animation_type = 'float', animation_offset = 0.2, press_state = self.STATES['menu'], game = self)
+				)
+
+			case 'over':
+				self.game_over_sprites.add(
+					MenuBackground(pos = (CENTRE_X, 0), offset = HEIGHT // 2),
+					Button(type = 'try-again', pos = (CENTRE_X, CENTRE_Y + 60), animation_type = 'float', animation_offset = 0.2, press_state = self.STATES['play'], game = self),
+					Button(type = 'main-menu', pos = (CENTRE_X, CENTRE_Y + 160), animation_type = 'float', animation_offset = 0.2, press_state = self.STATES['menu'], game = self)
+				)
+
+	def build_play(self) -> None:
+
+		self.SFX['chilli'] = {
+			'collect': cache.sound('audio/sfx/chilli/collect.mp3'),
+		}
+		self.SFX['player'] = {
+			'death': cache.sound('audio/sfx/player/death.mp3'),
+			'jump': cache.sound('audio/sfx/player/jump.wav')
+		}
+		self.SFX['player']['jump'].set_volume(2 * VOLUMES['sfx'])
+
+		# preload obstacle surfaces so spawning never decodes from disk
+		cache.preload([
+			('images/fork/fork.png', 1.5, 0.0),
+			('images/fork/fork.png', 1.5, 180.0),
+			('images/chilli/chilli.png', 1.25, 0.0)
+		])
+		cache.mask(cache.text(main_font, '+100', False, COLOURS['light_yellow'], COLOURS['black']))
+
+		# every fork pair + chilli lives in the obstacle world; their sprites are only drawn + mask-tested
+		self.world = world.ObstacleWorld(
+			fork_size = cache.image('images/fork/fork.png', scale = 1.5).get_size(),
+			chilli_size = cache.image('images/chilli/chilli.png', scale = 1.25).get_size(),
+			chilli_offset = Chilli.OFFSET
+		)
+
+		# most columns ever alive at once: one per spawn interval across the screen, plus one leaving it
+		columns = int((WIDTH + self.world.extent) // self.spawner.spacing) + 2
+		for obstacle_pool in (self.fork_pair_pool, self.chilli_pool): obstacle_pool.prewarm(columns)
+
+	@ property
+	def score(self) -> int:
+		return self._score
+
+	@ score.setter
+	def score(self, score: int) -> None:
+		self._score = score
+		self.text.invalidate('score', 'over_score')
+
+	@ property
+	def high_score(self) -> int:
+		return self._high_score
+
+	@ high_score.setter
+	def high_score(self, high_score: int) -> None:
+		self._high_score = high_score
+		self.text.invalidate('high_score', 'over_high_score')
 
 	def start(self) -> None:
+
 		self._started = True
+
+		if self.replay_path: 
+			self.recorder = replay.ReplayWriter.open(self.replay_path, {'tick_rate': self.TICK_RATE, 'seed': self.seed, 'costume_index': self.player.sprite.image_index, 'ticks': 0})
+
+	def stop_recording(self) -> None:
+
+		if self.recorder: 
+			self.recorder.close()
+			self.recorder = None
 	
 	@ property
 	def started(self) -> bool:
 		return self._started
 
+	@ property
+	def fork_spacing(self) -> float:
+		return self._FORK_SPEED * self._FORK_FREQUENCY / 1000
+
+	def generate_column(self) -> ColumnDict:
+
+		self._rng_state = None
+
+		return {
+			'y_offset': self.rng.randint(int(HEIGHT / 3), int(HEIGHT - HEIGHT / 3)),
+			'chilli': self.rng.randint(0, self.CHILLI_FREQUENCY) == 0
+		}
+
+	def spawn_forks(self, x: float, column: ColumnDict) -> None:
+
+		kind = self.world.FORK | (self.world.CHILLI if column['chilli'] else 0)
+		self.world.spawn(x = x, y = column['y_offset'], kind = kind, payload = self.column_sprites(column['y_offset'], column['chilli']))
+
+	def column_sprites(self, y_offset: int, has_chilli: bool) -> tuple['ForkPair', 'Chilli | None']:
+
+		# a column's sprites, from the pools and back at the right edge
+		pair = self.fork_pair_pool.acquire()
+		pair.spawn(y_offset)
+		self.forks.add(pair.up, pair.down)
+		chilli = None
+
+		if has_chilli: 
+
+			chilli = self.chilli_pool.acquire()
+			chilli.spawn(y_offset)
+			self.chillies.add(chilli)
+
+		return pair, chilli
+
+	def next_gap(self) -> float | None:
+
+		# centre y of the first fork gap the player has not flown clear of yet
+		index = self.world.next_column(self.player.sprite.rect.left)
+		return float(self.world.y[index]) if index != -1 else None
+
+	def place_obstacles(self, xs: np.ndarray) -> None:
+
+		for (pair, chilli), x in zip(self.world.payloads, xs.tolist()):
+
+			pair.place(x)
+			if chilli: chilli.place(x)
+
+	def step(self, dt: float) -> None:
+
+		# one fixed tick of the play simulation
+		self.background.update(dt)
+
+		self.player.update(dt)
+
+		# obstacles - each stage is one vectorised pass over every column
+		obstacles = self.world
+		player = self.player.sprite
+
+		for index in obstacles.collect_chillies(tuple(player.rect)): 
+
+			chilli = obstacles.payloads[index][1]
+			chilli.place(obstacles.x[index])
+			chilli.collect()
+
+		# columns due this tick spawn where they would be had they entered exactly on time
+		distance = self._FORK_SPEED * dt
+		for overshoot, column in self.spawner.advance(distance): self.spawn_forks(WIDTH + distance - overshoot, column)
+		obstacles.scroll(distance)
+
+		self.release_obstacles(obstacles.cull())
+
+		for _ in range(obstacles.update_passed(player.pos.x)): self.point()
+
+	def release_obstacles(self, columns: list[tuple['ForkPair', 'Chilli | None']]) -> None:
+
+		for pair, chilli in columns:
+
+			pair.up.kill()
+			pair.down.kill()
+			self.fork_pair_pool.release(pair)
+
+			if chilli: 
+				chilli.kill()
+				self.chilli_pool.release(chilli)
+
+	def fork_hit(self) -> bool:
+
+		# swept collision - since the last tick the player and the forks each moved in a straight line, so the
+		# whole relative path is tested and a big step can't carry the taco through a tine.
+		# broadphase: columns are sorted by x, so only those the player's rect swept past horizontally are tested
+		# (one fork pair at most at normal spacing, however many are on screen)
+		player = self.player.sprite
+		obstacles = self.world
+		rect = player.rect
+		start_top = round(player.previous_pos.y) - rect.height // 2
+		end_top = round(player.pos.y) - rect.height // 2
+
+		for index in obstacles.overlapping(rect.left - obstacles.scrolled, rect.right):
+
+			pair: ForkPair = obstacles.payloads[index][0]
+			if pair.hit(player, float(obstacles.previous_x[index]), float(obstacles.x[index]), start_top, end_top): return True
+
+		return False
+
+	def interpolate(self, alpha: float) -> None:
+
+		# place every moving sprite between its last two ticks for drawing
+		for sprite in self.background: sprite.interpolate(alpha)
+		self.place_obstacles(self.world.interpolated_x(alpha))
+		self.player.sprite.interpolate(alpha)
+
+	def snapshot(self) -> SnapshotDict:
+
+		# the whole round's state as arrays + a few immutables - sprites are rebuilt from them on restore()
+		player = self.player.sprite
+		if self._rng_state is None: self._rng_state = self.rng.getstate()
+
+		return {
+			'scalars': np.array((
+				self._state, self._started, self._paused, self._score, self.chillies_collected, self.seed,
+				player.pos.y, player.previous_pos.y, player.y_vel, player._chilli_energy, player.jumping,
+				self.spawner.until_next, self.world.scrolled
+			), dtype = np.float64),
+			'columns': self.world.snapshot(),
+			'background': np.array([(sprite.pos.x, sprite.previous_x) for sprite in self.background], dtype = np.float64),
+			'upcoming': tuple(self.spawner.queue),
+			'rng': self._rng_state,
+			'death_cause': player.death_cause
+		}
+
+	def restore(self, snapshot: SnapshotDict) -> None:
+
+		# back to exactly where snapshot() was taken; the same inputs from here replay the same ticks.
+		# a recording can't follow a jump back in time, so it ends here
+		self.stop_recording()
+
+		state, started, paused, score, chillies_collected, seed, y, previous_y, y_vel, chilli_energy, jumping, until_next, scrolled = snapshot['scalars'].tolist()
+		self.state = int(state)
+		self._started = bool(started)
+		self._paused = bool(paused)
+		self.score = int(score)
+		self.chillies_collected = int(chillies_collected)
+		self.seed = int(seed)
+		self.rng.setstate(snapshot['rng'])
+		self._rng_state = snapshot['rng']
+
+		player = self.player.sprite
+		player.pos.y = y
+		player.previous_pos = pygame.math.Vector2(player.pos.x, previous_y)
+		player.rect.center = (round(player.pos.x), round(y))
+		player.y_vel = y_vel
+		player.chilli_energy = int(chilli_energy)
+		player.jumping = bool(jumping)
+		player.death_cause = snapshot['death_cause']
+		self.text.invalidate('over_death')
+
+		self.spawner.until_next = until_next
+		self.spawner.queue.clear()
+		self.spawner.queue.extend(snapshot['upcoming'])
+
+		for sprite, (x, previous_x) in zip(self.background, snapshot['background'].tolist()):
+
+			sprite.pos.x, sprite.previous_x = x, previous_x
+			sprite.rect.centerx = round(x)
+
+		# obstacles - the rows come back as they were, bound to sprites from the pools
+		columns = snapshot['columns']
+		self.release_obstacles(self.world.clear())
+		payloads = [self.column_sprites(int(y_offset), bool(int(kind) & self.world.CHILLI)) for y_offset, kind in zip(columns[2].tolist(), columns[3].tolist())]
+		self.world.restore(columns, scrolled, payloads)
+
+		for (pair, chilli), collected in zip(payloads, columns[5].tolist()):
+			if chilli and collected: chilli.show_collected()
+
+		self.place_obstacles(self.world.x[:self.world.count])
+
 	def chilli_collected(self) -> None:
+
+		self.chillies_collected += 1
 		self.player.sprite.chilli_energy += 200
 
-	def restart(self) -> None:
+	def restart(self, seed: int | None = None) -> None:
+
+		self.stop_recording()
+		self.seed = random.getrandbits(32) if seed is None else seed
+		self.rng.seed(self.seed)
+		self._rng_state = None
 
 		self.state = self.STATES['play']
 		self._started = False
 		self._paused = False
 		self.score = 0
+		self.chillies_collected = 0
 		self.player.sprite.reset()
-		self.forks.empty()
-		self.chillies.empty()
+		self.release_obstacles(self.world.clear())
+		self.spawner.spacing = self.fork_spacing
+		self.spawner.reset()
 		[sprite.reset() for sprite in self.game_over_sprites.sprites() if hasattr(sprite, 'reset')]
 		[sprite.reset() for sprite in self.menu_sprites.sprites() if hasattr(sprite, 'reset')]
 		
 	def handle_game_over(self) -> None:
 
+		self.stop_recording()
 		self.SFX['player']['death'].play()
 		self.state = self.STATES['over']
+		self.text.invalidate('over_death')
 
 	def point(self) -> None:
 
@@ -224,6 +557,9 @@ class Game:
 		if to_quit:
 
 			logger.info('quit confirmed, quitting game...')
+			self.stop_recording()
+			logger.info(f'text cache: {cache.texts.hits} hits, {cache.texts.misses} misses, {len(cache.texts)}/{cache.texts.max_size} surfaces')
+			for obstacle_pool in (self.fork_pair_pool, self.chilli_pool): logger.info(f'{obstacle_pool.name} pool: {obstacle_pool.hits} hits, {obstacle_pool.misses} misses, {len(obstacle_pool)} free')
 			
 			config: file_config.ConfigDict = {
 				'screen_setup': {
@@ -246,6 +582,7 @@ class Game:
 			file_handler.save_data(mode = 0, data = config)
 			file_handler.save_data(mode = 1, data = user_data)
 
+			cache.stop_builds()
 			pygame.quit()
 			exit()
 		
@@ -253,234 +590,263 @@ class Game:
 
 class Text:
 
+	# dynamic HUD values - each is only re-rendered once invalidated
+	WIDGETS = ('fps', 'score', 'high_score', 'chilli_energy', 'costume_menu', 'costume_choose', 'over_score', 'over_high_score', 'over_death')
+
 	def __init__(self, game: Game) -> None:
 
 		self.game = game
-		self.texts: list[tuple[pygame.surface.Surface, pygame.rect.Rect]] = []
+		self.texts: list[list] = []
+
+		# a lean game leaves the artwork out; its labels keep their place with nothing drawn
+		self._artwork = cache.image if game.presentation else lambda path, scale: pygame.surface.Surface((0, 0))
 
 		# Texts
 
 		self.fps_text1 = secondary_font.render('FPS:', False, COLOURS['light_grey'], COLOURS['black'])
 		self.fps_text1_rect = self.fps_text1.get_rect(topleft = (0, 0))
 
-		self.fps_text2 = pygame.surface.Surface((0, 0))
-		self.fps_text2_rect = self.fps_text2.get_rect(topleft = (0, 0))
+		# Play Screen
+		self.play_txt1 = main_font.render('Click to Begin', False, COLOURS['light_yellow'])
+		self.play_txt1_rect = self.play_txt1.get_rect(center = (CENTRE_X, CENTRE_Y - 100))
+
+		self.play_txt4 = secondary_font.render('SCORE:', False, COLOURS['light_grey'], COLOURS['black'])
+		self.play_txt4_rect = self.play_txt4.get_rect(topright = (WIDTH, 80))
 
-		# Menu Screen
-		self.menu_txt1 = pygame.image.load(assets.resource_path('images/text/flappy.png')).convert_alpha()
-		self.menu_txt1 = pygame.transform.scale_by(self.menu_txt1, 0.25)
-		self.menu_txt1_rect = self.menu_txt1.get_rect(topleft = (100, 100))
+		self.play_txt5 = secondary_font.render('HIGHSCORE:', False, COLOURS['light_grey'], COLOURS['black'])
+		self.play_txt5_rect = self.play_txt5.get_rect(topright = (WIDTH, 0))
 
-		self.menu_txt2 = pygame.image.load(assets.resource_path('images/text/taco!.png')).convert_alpha()
-		self.menu_txt2 = pygame.transform.scale_by(self.menu_txt2, 0.4)
-		self.menu_txt2_rect = self.menu_txt2.get_rect(center = (CENTRE_X, CENTRE_Y - 50))
+		self.play_txt6 = secondary_font.render('CHILLI ENERGY:', False, COLOURS['yellow'], COLOURS['black'])
+		self.play_txt6_rect = self.play_txt6.get_rect(topleft = (0, 40))
 
-		# Control Screen
-		self.control_txt1 = pygame.image.load(assets.resource_path('images/text/help.png')).convert_alpha()
-		self.control_txt1 = pygame.transform.scale(self.control_txt1, (WIDTH, HEIGHT))
-		self.control_txt1_rect = self.control_txt1.get_rect(center = (CENTRE_X, CENTRE_Y))
+		# Dynamic Widgets - [surface, rect], updated in place so the views below never need rebuilding
+		empty = pygame.surface.Surface((0, 0))
+		self.widgets: dict[str, list] = {name: [empty, empty.get_rect()] for name in self.WIDGETS}
+		self._invalid: set[str] = set(self.WIDGETS)
+		self._fps = -1
 
-		# Game Over Screen
-		self.over_txt1 = pygame.image.load(assets.resource_path('images/text/game-over.png')).convert_alpha()
-		self.over_txt1 = pygame.transform.scale_by(self.over_txt1, 0.25)
-		self.over_txt1_rect = self.over_txt1.get_rect(center = (CENTRE_X, CENTRE_Y - 150))
+		# Views - built by view() the first time each is shown, so the artwork of a scene is only waited for once it is entered
+		self.views: dict[str, list[list]] = {'none': []}
 
-		self.over_txt2 = pygame.surface.Surface((0, 0))
-		self.over_txt2_rect = self.over_txt2.get_rect(topleft = (0, 0))
+	def _artwork_label(self, path: str, scale: float | tuple[int, int], **position: tuple[int, int]) -> tuple[pygame.surface.Surface, pygame.rect.Rect]:
 
-		self.over_txt3 = pygame.surface.Surface((0, 0))
-		self.over_txt3_rect = self.over_txt3.get_rect(topleft = (0, 0))
+		image = self._artwork(path, scale = scale)
+		return image, image.get_rect(**position)
 
-		self.over_txt4 = pygame.surface.Surface((0, 0))
-		self.over_txt4_rect = self.over_txt4.get_rect(topleft = (0, 0))
+	def view(self, name: str) -> list[list]:
 
-		# Play Screen
-		self.play_txt1 = main_font.render('Click to Begin', False, COLOURS['light_yellow'])
-		self.play_txt1_rect = self.play_txt1.get_rect(center = (CENTRE_X, CENTRE_Y - 100))
+		# one composed overlay of every static label + the widgets drawn over it
+		view = self.views.get(name)
+		if view is not None: return view
 
-		self.play_txt2 = pygame.image.load(assets.resource_path('images/text/paused.png')).convert_alpha()
-		self.play_txt2 = pygame.transform.scale_by(self.play_txt2, 0.3)
-		self.play_txt2_rect = self.play_txt2.get_rect(center = (CENTRE_X, CENTRE_Y - 120))
+		labels = [
+			(self.play_txt4, self.play_txt4_rect),
+			(self.play_txt5, self.play_txt5_rect),
+			(self.play_txt6, self.play_txt6_rect),
+			(self.fps_text1, self.fps_text1_rect)
+		]
+		play_widgets = ('score', 'high_score', 'chilli_energy', 'fps')
 
-		self.play_txt4 = secondary_font.render('SCORE:', False, COLOURS['light_grey'], COLOURS['black'])
-		self.play_txt4_rect = self.play_txt4.get_rect(topright = (WIDTH, 80))
+		match name:
 
-		self.score_txt = pygame.surface.Surface((0, 0))
-		self.score_txt_rect = self.score_txt.get_rect(topleft = (0, 0))
+			case 'menu':
+				view = self._view(
+					[
+						self._artwork_label('images/text/flappy.png', 0.25, topleft = (100, 100)),
+						self._artwork_label('images/text/taco!.png', 0.4, center = (CENTRE_X, CENTRE_Y - 50)),
+						(self.play_txt5, self.play_txt5_rect),
+						(self.fps_text1, self.fps_text1_rect)
+					],
+					('high_score', 'fps', 'costume_menu')
+				)
 
-		self.play_txt5 = secondary_font.render('HIGHSCORE:', False, COLOURS['light_grey'], COLOURS['black'])
-		self.play_txt5_rect = self.play_txt5.get_rect(topright = (WIDTH, 0))
+			case 'help':
+				view = self._view([self._artwork_label('images/text/help.png', (WIDTH, HEIGHT), center = (CENTRE_X, CENTRE_Y))], ())
 
-		self.high_score_txt = pygame.surface.Surface((0, 0))
-		self.high_score_txt_rect = self.high_score_txt.get_rect(topleft = (0, 0))
+			case 'over':
+				view = self._view(
+					[self._artwork_label('images/text/game-over.png', 0.25, center = (CENTRE_X, CENTRE_Y - 150))] + labels,
+					('over_score', 'over_high_score', 'over_death') + play_widgets
+				)
 
-		self.play_txt6 = secondary_font.render('CHILLI ENERGY:', False, COLOURS['yellow'], COLOURS['black'])
-		self.play_txt6_rect = self.play_txt6.get_rect(topleft = (0, 40))
+			case 'play_ready':
+				view = self._view([(self.play_txt1, self.play_txt1_rect)] + labels, play_widgets)
+
+			case 'play_paused':
+				view = self._view([self._artwork_label('images/text/paused.png', 0.3, center = (CENTRE_X, CENTRE_Y - 120))] + labels, play_widgets)
+
+			case 'play':
+				view = self._view(labels, play_widgets)
+
+			case 'choose_taco':
+				view = self._view(
+					[self._artwork_label('images/text/choose-costume.png', 0.3, center = (CENTRE_X, 75)), (self.fps_text1, self.fps_text1_rect)],
+					('costume_choose', 'fps')
+				)
+
+			case _:
+				raise KeyError(name)
+
+		self.views[name] = view
+		return view
+
+	def _view(self, labels: list[tuple[pygame.surface.Surface, pygame.rect.Rect]], widgets: tuple[str, ...]) -> list[list]:
+
+		if len(labels) == 1: 
+			overlay, overlay_rect = labels[0]
+
+		else:
+
+			overlay_rect = labels[0][1].unionall([rect for _, rect in labels[1:]])
+			overlay = pygame.surface.Surface(overlay_rect.size, pygame.SRCALPHA).convert_alpha()
+			overlay.fill((0, 0, 0, 0))
+			drawn: list[pygame.rect.Rect] = []
+
+			for surface, rect in labels:
+
+				# copy per-pixel alpha labels straight onto untouched (transparent) pixels, blend where labels overlap
+				flags = pygame.BLEND_RGBA_MAX if surface.get_flags() & pygame.SRCALPHA and rect.collidelist(drawn) == -1 else 0
+				overlay.blit(surface, rect.move(-overlay_rect.x, -overlay_rect.y), special_flags = flags)
+				drawn.append(rect)
 
-		self.chilli_energy_txt = pygame.surface.Surface((0, 0))
-		self.chilli_energy_txt_rect = self.chilli_energy_txt.get_rect(topleft = (0, 0))
+			overlay.set_alpha(255, pygame.RLEACCEL) # skip the transparent gaps between labels quickly
 
-		# Choose Taco Screen
-		self.choose_taco_txt1 = pygame.image.load(assets.resource_path('images/text/choose-costume.png')).convert_alpha()
-		self.choose_taco_txt1 = pygame.transform.scale_by(self.choose_taco_txt1, 0.3)
-		self.choose_taco_txt1_rect = self.choose_taco_txt1.get_rect(center = (CENTRE_X, 75))
+		return [[overlay, overlay_rect]] + [self.widgets[name] for name in widgets]
 
-		self.choose_taco_txt2 = pygame.surface.Surface((0, 0))
-		self.choose_taco_txt2_rect = self.choose_taco_txt2.get_rect(topleft = (0, 0))
+	def invalidate(self, *widgets: str) -> None:
+		self._invalid.update(widgets)
+
+	def _render(self, name: str) -> None:
+
+		widget = self.widgets[name]
+
+		match name:
+
+			case 'fps':
+				fps_colour = COLOURS['green'] if (self._fps >= 60) else COLOURS['yellow'] if (self._fps < 60 and self._fps >= 10) else COLOURS['red']
+				widget[0] = cache.text(secondary_font, str(self._fps), False, fps_colour, COLOURS['black'])
+				widget[1] = widget[0].get_rect(topleft = (75, 0))
+
+			case 'score':
+				widget[0] = cache.text(main_font, str(self.game.score), False, COLOURS['white'], COLOURS['black'])
+				widget[1] = widget[0].get_rect(topright = (WIDTH, 110))
+
+			case 'high_score':
+				widget[0] = cache.text(main_font, str(self.game.high_score), False, COLOURS['white'], COLOURS['black'])
+				widget[1] = widget[0].get_rect(topright = (WIDTH, 30))
+
+			case 'chilli_energy':
+				widget[0] = cache.text(main_font, str(self.game.player.sprite.chilli_energy), False, COLOURS['light_yellow'], COLOURS['black'])
+				widget[1] = widget[0].get_rect(topleft = (0, 70))
+
+			case 'costume_menu':
+				widget[0] = cache.text(main_font, self.game.player.sprite.costume_name(), False, COLOURS['light_yellow'], COLOURS['black'])
+				widget[1] = widget[0].get_rect(center = (CENTRE_X + 150, CENTRE_Y + 75))
+
+			case 'costume_choose':
+				widget[0] = cache.text(main_font, self.game.player.sprite.costume_name(), False, COLOURS['light_yellow'], COLOURS['black'])
+				widget[1] = widget[0].get_rect(center = (CENTRE_X, CENTRE_Y - 150))
+
+			case 'over_score':
+				widget[0] = cache.text(secondary_font, f"Final Score: {self.game.score}", False, COLOURS['light_grey'], COLOURS['black'])
+				widget[1] = widget[0].get_rect(center = (CENTRE_X, CENTRE_Y - 40))
+
+			case 'over_high_score':
+				widget[0] = cache.text(secondary_font, f"HIGHSCORE: {self.game.high_score}", False, COLOURS['light_grey'], COLOURS['black'])
+				widget[1] = widget[0].get_rect(center = (CENTRE_X, CENTRE_Y - 10))
+
+			case 'over_death':
+				widget[0] = cache.text(secondary_font, f"You {self.game.player.sprite.death_cause}!", False, COLOURS['red'], COLOURS['black'])
+				widget[1] = widget[0].get_rect(center = (CENTRE_X, CENTRE_Y - 80))
 
 	def update(self) -> None:
 
 		fps = round(clock.get_fps())
-		fps_colour = COLOURS['green'] if (fps >= 60) else COLOURS['yellow'] if (fps < 60 and fps >= 10) else COLOURS['red']
-		self.fps_text2 = secondary_font.render(str(fps), False, fps_colour, COLOURS['black'])
-		self.fps_text2_rect = self.fps_text2.get_rect(topleft = (75, 0))
 
-		state = self.game.state
-
-		if state == self.game.STATES['menu']:
+		if fps != self._fps:
+			self._fps = fps
+			self._invalid.add('fps')
 
-			self.high_score_txt = main_font.render(str(self.game.high_score), False, COLOURS['white'], COLOURS['black'])
-			self.high_score_txt_rect = self.high_score_txt.get_rect(topright = (WIDTH, 30))
+		while self._invalid: self._render(self._invalid.pop())
 
-			self.choose_taco_txt2 = main_font.render(self.game.player.sprite.costume_name(), False, COLOURS['light_yellow'], COLOURS['black'])
-			self.choose_taco_txt2_rect = self.choose_taco_txt2.get_rect(center = (CENTRE_X + 150, CENTRE_Y + 75))
+		state = self.game.state
 
-			self.texts = [
-				(self.menu_txt1, self.menu_txt1_rect), 
-				(self.menu_txt2, self.menu_txt2_rect),
-				(self.play_txt5, self.play_txt5_rect),
-				(self.high_score_txt, self.high_score_txt_rect),
-				(self.fps_text1, self.fps_text1_rect),
-				(self.fps_text2, self.fps_text2_rect),
-				(self.choose_taco_txt2, self.choose_taco_txt2_rect)
-			]
-		
-		elif state == self.game.STATES['help']:
-
-			self.texts = [
-				(self.control_txt1, self.control_txt1_rect),
-			]
-
-		elif state == self.game.STATES['over']:
-
-			self.over_txt2 = secondary_font.render(f"Final Score: {self.game.score}", False, COLOURS['light_grey'], COLOURS['black'])
-			self.over_txt2_rect = self.over_txt2.get_rect(center = (CENTRE_X, CENTRE_Y - 40))
-
-			self.over_txt3 = secondary_font.render(f"HIGHSCORE: {self.game.high_score}", False, COLOURS['light_grey'], COLOURS['black'])
-			self.over_txt3_rect = self.over_txt3.get_rect(center = (CENTRE_X, CENTRE_Y - 10))
-
-			self.over_txt4 = secondary_font.render(f"You {self.game.player.sprite.death_cause}!", False, COLOURS['red'], COLOURS['black'])
-			self.over_txt4_rect = self.over_txt4.get_rect(center = (CENTRE_X, CENTRE_Y - 80))
-
-			self.texts = [
-				(self.over_txt1, self.over_txt1_rect),
-				(self.over_txt2, self.over_txt2_rect),
-				(self.over_txt3, self.over_txt3_rect),
-				(self.over_txt4, self.over_txt4_rect),
-				(self.play_txt4, self.play_txt4_rect),
-				(self.play_txt5, self.play_txt5_rect),
-				(self.play_txt6, self.play_txt6_rect),
-				(self.score_txt, self.score_txt_rect),
-				(self.high_score_txt, self.high_score_txt_rect),
-				(self.chilli_energy_txt, self.chilli_energy_txt_rect),
-				(self.fps_text1, self.fps_text1_rect),
-				(self.fps_text2, self.fps_text2_rect)
-			]
+		if state == self.game.STATES['menu']: self.texts = self.view('menu')
+		elif state == self.game.STATES['help']: self.texts = self.view('help')
+		elif state == self.game.STATES['over']: self.texts = self.view('over')
+		elif state == self.game.STATES['choose_taco']: self.texts = self.view('choose_taco')
 
 		elif state == self.game.STATES['play']:
 
-			self.score_txt = main_font.render(str(self.game.score), False, COLOURS['white'], COLOURS['black'])
-			self.score_txt_rect = self.score_txt.get_rect(topright = (WIDTH, 110))
-
-			self.high_score_txt = main_font.render(str(self.game.high_score), False, COLOURS['white'], COLOURS['black'])
-			self.high_score_txt_rect = self.high_score_txt.get_rect(topright = (WIDTH, 30))
-
-			self.chilli_energy_txt = main_font.render(str(self.game.player.sprite.chilli_energy), False, COLOURS['light_yellow'], COLOURS['black'])
-			self.chilli_energy_txt_rect = self.chilli_energy_txt.get_rect(topleft = (0, 70))
-
-			if not self.game.started:
-
-				self.texts = [
-					(self.play_txt1, self.play_txt1_rect),
-					(self.play_txt4, self.play_txt4_rect),
-					(self.play_txt5, self.play_txt5_rect),
-					(self.play_txt6, self.play_txt6_rect),
-					(self.score_txt, self.score_txt_rect),
-					(self.high_score_txt, self.high_score_txt_rect),
-					(self.chilli_energy_txt, self.chilli_energy_txt_rect),
-					(self.fps_text1, self.fps_text1_rect),
-					(self.fps_text2, self.fps_text2_rect)
-				]
-
-			elif self.game.started and self.game.paused:
-
-				self.texts = [
-					(self.play_txt2, self.play_txt2_rect),
-					(self.play_txt4, self.play_txt4_rect),
-					(self.play_txt5, self.play_txt5_rect),
-					(self.play_txt6, self.play_txt6_rect),
-					(self.score_txt, self.score_txt_rect),
-					(self.high_score_txt, self.high_score_txt_rect),
-					(self.chilli_energy_txt, self.chilli_energy_txt_rect),
-					(self.fps_text1, self.fps_text1_rect),
-					(self.fps_text2, self.fps_text2_rect)	
-				]
-
-			else:
-
-				self.texts = [
-					(self.play_txt4, self.play_txt4_rect),
-					(self.play_txt5, self.play_txt5_rect),
-					(self.play_txt6, self.play_txt6_rect),
-					(self.score_txt, self.score_txt_rect),
-					(self.high_score_txt, self.high_score_txt_rect),
-					(self.chilli_energy_txt, self.chilli_energy_txt_rect),
-					(self.fps_text1, self.fps_text1_rect),
-					(self.fps_text2, self.fps_text2_rect)
-				]
-
-		elif state == self.game.STATES['choose_taco']:
-
-			self.choose_taco_txt2 = main_font.render(self.game.player.sprite.costume_name(), False, COLOURS['light_yellow'], COLOURS['black'])
-			self.choose_taco_txt2_rect = self.choose_taco_txt2.get_rect(center = (CENTRE_X, CENTRE_Y - 150))
-		
-			self.texts = [
-				(self.choose_taco_txt1, self.choose_taco_txt1_rect),
-				(self.choose_taco_txt2, self.choose_taco_txt2_rect),
-				(self.fps_text1, self.fps_text1_rect),
-				(self.fps_text2, self.fps_text2_rect)
-			]
+			if not self.game.started: self.texts = self.view('play_ready')
+			elif self.game.paused: self.texts = self.view('play_paused')
+			else: self.texts = self.view('play')
 
 		else:
-			self.texts.clear()
+			self.texts = self.view('none')
+
+# Controllers - whether the jump input is held this tick
+Controller = Callable[[], bool]
+
+def mouse_controller() -> bool:
+	return pygame.mouse.get_pressed()[0]
 
 class Player(pygame.sprite.Sprite):
 
+	PREVIEW_SCALE = 0.525 # choose-taco preview, 1.75x the in-game taco
+
 	def __init__(self, user_data: file_config.UserDataDict, game: Game) -> None:
 
 		super().__init__()
 		self.game = game
 
-		self.images = [pygame.transform.scale_by(pygame.image.load(assets.resource_path(f'images/player/taco{i}.png')).convert_alpha(), 0.3) for i in range(7)]
+		self.images = [cache.image(f'images/player/taco{i}.png', scale = 0.3) for i in range(7)]
 
-		self.image_index = int(user_data['costume_index'])
+		self._image_index = int(user_data['costume_index'])
+		self.masks = [cache.mask(image) for image in self.images]
+		self.opaque_bounds = [mask.get_bounding_rects()[0].unionall(mask.get_bounding_rects()) for mask in self.masks] # relative to rect
+		# choose-taco preview, from the cache the first time each costume is shown - never in a lean game, never the gameplay image / rect
+		self.previews: dict[int, tuple[pygame.surface.Surface, pygame.rect.Rect]] = {}
 		self.image = self.images[self.image_index]
-		self.mask = pygame.mask.from_surface(self.images[0])
+		self.mask = self.masks[self.image_index]
+		self.opaque = self.opaque_bounds[self.image_index]
 
-		self.rect = self.images[0].get_rect(center = (CENTRE_X - 200, CENTRE_Y))
+		self.rect = self.image.get_rect(center = (CENTRE_X - 200, CENTRE_Y))
 		self.pos = pygame.math.Vector2(self.rect.center)
+		self.previous_pos = pygame.math.Vector2(self.pos)
 
-		self.SFX: PlayerSFXDict = self.game.SFX['player']
-		self.SFX['jump'].set_volume(2 * VOLUMES['sfx'])
 
 		self.GRAVITY = 3000
 		self.MAX_CHILLI_ENERGY = 1000
 		self.JUMP_COST = 25
 		self.JUMP_BOOST = 750
 		self.y_vel = 0.0
-		self.chilli_energy = self.MAX_CHILLI_ENERGY
+		self._chilli_energy = self.MAX_CHILLI_ENERGY
 		self.death_cause = ''
 		self.jumping = False
+		self.controller: Controller = mouse_controller # swapped out to drive the player without a mouse
+
+	@ property
+	def SFX(self) -> PlayerSFXDict:
+		return self.game.SFX['player'] # built with the play scene
+
+	@ property
+	def chilli_energy(self) -> int:
+		return self._chilli_energy
+
+	@ chilli_energy.setter
+	def chilli_energy(self, chilli_energy: int) -> None:
+		self._chilli_energy = chilli_energy
+		self.game.text.invalidate('chilli_energy')
+
+	@ property
+	def image_index(self) -> int:
+		return self._image_index
+
+	@ image_index.setter
+	def image_index(self, image_index: int) -> None:
+		self._image_index = image_index
+		self.game.text.invalidate('costume_menu', 'costume_choose')
 
 	def update(self, dt: float) -> None:
 
@@ -488,12 +854,19 @@ class Player(pygame.sprite.Sprite):
 		self.rect.center = (round(self.pos.x), round(self.pos.y))
 		if self.chilli_energy > self.MAX_CHILLI_ENERGY: self.chilli_energy = self.MAX_CHILLI_ENERGY
 		self.input()
-		self.check_death()
+		self.check_death() # sweeps from previous_pos, where the last tick started
+		self.previous_pos = pygame.math.Vector2(self.pos)
 		self.fall(dt)
 
+	def interpolate(self, alpha: float) -> None:
+
+		pos = self.previous_pos.lerp(self.pos, alpha)
+		self.rect.center = (round(pos.x), round(pos.y))
+
 	def input(self) -> None:
 		
-		mouse_pressed = pygame.mouse.get_pressed()[0]
+		mouse_pressed = self.controller()
+		if self.game.recorder: self.game.recorder.write(mouse_pressed)
 
 		if mouse_pressed and not self.jumping:
 
@@ -506,9 +879,11 @@ class Player(pygame.sprite.Sprite):
 	def reset(self) -> None:
 
 		self.pos = pygame.math.Vector2(CENTRE_X - 200, CENTRE_Y)
+		self.previous_pos = pygame.math.Vector2(self.pos)
 		self.image = self.images[self.image_index]
-		self.mask = pygame.mask.from_surface(self.images[0])
-		self.rect = self.images[0].get_rect(center = self.pos)
+		self.mask = self.masks[self.image_index]
+		self.opaque = self.opaque_bounds[self.image_index]
+		self.rect = self.image.get_rect(center = self.pos)
 		self.chilli_energy = self.MAX_CHILLI_ENERGY
 		self.y_vel = 0.0
 		self.jumping = False
@@ -516,12 +891,10 @@ class Player(pygame.sprite.Sprite):
 
 	def check_death(self) -> None:
 
-		if pygame.sprite.spritecollide(self, self.game.forks, False, pygame.sprite.collide_rect):
-
-			if pygame.sprite.spritecollide(self, self.game.forks, False, pygame.sprite.collide_mask): 
+		if self.game.fork_hit(): 
 			
-				self.death_cause = 'crashed into a Fork'
-				self.game.handle_game_over()
+			self.death_cause = 'crashed into a Fork'
+			self.game.handle_game_over()
 
 		if self.pos.y <= 0 + (self.image.get_height() / 2) or self.pos.y >= HEIGHT - (self.image.get_height() / 2): 
 			
@@ -546,99 +919,148 @@ class Player(pygame.sprite.Sprite):
 			self.y_vel = -self.JUMP_BOOST
 			self.chilli_energy -= self.JUMP_COST
 
-	def costume_display(self) -> None:
+	def costume_display(self) -> tuple[pygame.surface.Surface, pygame.rect.Rect]:
 
-		self.image = self.images[self.image_index]
-		self.image = pygame.transform.scale_by(self.images[self.image_index], 1.75)
-		self.rect = self.image.get_rect(center = (CENTRE_X, CENTRE_Y))
+		preview = self.previews.get(self.image_index)
+
+		if preview is None:
+
+			image = cache.image(f'images/player/taco{self.image_index}.png', scale = self.PREVIEW_SCALE)
+			preview = self.previews[self.image_index] = (image, image.get_rect(center = (CENTRE_X, CENTRE_Y)))
+
+		return preview
 
 	def costume_name(self) -> str:
 		return ['Taco', 'Wizard Taco', 'MLG Taco', 'Skateboarder Taco', 'Savage Taco', 'Gamer Taco', 'Holy Taco', 'Red Hot Devil Taco'][self.image_index]
 
 class Fork(pygame.sprite.Sprite):
 
-	def __init__(self, speed: int, orientation: str, offset: int, game: Game) -> None:
+	# half the height of the gap between a fork pair
+	GAP = 150
 
-		super().__init__()
+	def __init__(self, orientation: str) -> None:
 
-		self.image = pygame.image.load(assets.resource_path('images/fork/fork.png')).convert_alpha()
-		self.image = pygame.transform.scale_by(self.image, 1.5)
+		super().__init__()
 
-		if orientation == 'up':
+		if orientation == 'up': self.image = cache.image('images/fork/fork.png', scale = 1.5, rotation = 180.0)
+		if orientation == 'down': self.image = cache.image('images/fork/fork.png', scale = 1.5)
 
-			self.image = pygame.transform.rotate(self.image, 180.0)
-			self.rect = self.image.get_rect(bottomleft = (WIDTH, offset - 150))
-		
-		if orientation == 'down':
-			self.rect = self.image.get_rect(topleft = (WIDTH, offset + 150))
+		self.mask = cache.mask(self.image)
+		self.rect = self.image.get_rect()
+		self.bounds = self.mask.get_bounding_rects()[0].unionall(self.mask.get_bounding_rects()) # opaque area, relative to rect
+		self.tips = 0 # screen y of the tines' tips - where the gap really ends
 
-		self.pos = pygame.math.Vector2(self.rect.center)
-		self.SPEED = speed
 		self.orientation = orientation
-		self.game = game
-		self.passed = False
-	
-	def update(self, dt: float) -> None:
 
-		self.rect.center = (round(self.pos.x), round(self.pos.y))	
-		self.scroll(dt)
-		if not self.passed: self.update_score()
+	def spawn(self, offset: int) -> None:
 
-	def scroll(self, dt: float) -> None:
+		# (re)used from the pool - back to the right edge around a new gap
+		self.rect.left = WIDTH
 
-		self.pos.x -= self.SPEED * dt
-		if self.pos.x + (self.image.get_width() / 2) <= 0: self.kill()
+		if self.orientation == 'up': 
+			self.rect.bottom = offset - self.GAP
+			self.tips = self.rect.top + self.bounds.bottom
 
-	def update_score(self) -> None:
+		if self.orientation == 'down': 
+			self.rect.top = offset + self.GAP
+			self.tips = self.rect.top + self.bounds.top
 
-		if self.orientation == 'up':
+	def place(self, x: float) -> None:
+		self.rect.x = round(x)
 
-			if self.pos.x <= self.game.player.sprite.pos.x: 
-				
-				self.passed = True
-				self.game.point()
+class ForkPair:
+
+	# an 'up' and a 'down' fork around one gap - one interval test clears the player, masks only past the tines' tips
+	def __init__(self) -> None:
+
+		self.up = Fork(orientation = 'up')
+		self.down = Fork(orientation = 'down')
+
+	def spawn(self, offset: int) -> None:
+
+		self.up.spawn(offset)
+		self.down.spawn(offset)
+
+	def place(self, x: float) -> None:
+
+		self.up.place(x)
+		self.down.place(x)
+
+	def hit(self, player: Player, start_x: float, end_x: float, start_top: int, end_top: int) -> bool:
+
+		# this tick the player's rect top moved start_top -> end_top and the pair's left edge start_x -> end_x
+		self.place(end_x)
+		opaque = player.opaque
+		gap_top, gap_bottom = self.up.tips, self.down.tips
+
+		# interval test: the player's opaque extent stays inside the gap for the whole sweep
+		if min(start_top, end_top) + opaque.top >= gap_top and max(start_top, end_top) + opaque.bottom <= gap_bottom: return False
+
+		left = player.rect.left
+		steps = int(max(abs(end_top - start_top), start_x - end_x) // Game.SWEEP_STEP) + 1
+
+		for step in range(steps + 1):
+
+			t = step / steps
+			top = round(start_top + (end_top - start_top) * t)
+
+			# narrow band - only where the player reaches past the tips does the tines' silhouette matter
+			if top + opaque.top < gap_top: fork = self.up
+			elif top + opaque.bottom > gap_bottom: fork = self.down
+			else: continue
+
+			if fork.mask.overlap(player.mask, (left - round(start_x + (end_x - start_x) * t), top - fork.rect.top)): return True
+
+		return False
 
 class Chilli(pygame.sprite.Sprite):
 
-	def __init__(self, speed: int, y_offset: int, game: Game) -> None:
+	# centre x relative to the left edge of its fork pair
+	OFFSET = 50
+
+	def __init__(self, game: Game) -> None:
 
 		super().__init__()
 		self.game = game
 
-		self.chilli = pygame.image.load(assets.resource_path('images/chilli/chilli.png')).convert_alpha()
-		self.chilli = pygame.transform.scale_by(self.chilli, 1.25)
-		self.collect = main_font.render('+100', False, COLOURS['light_yellow'], COLOURS['black'])
+		self.chilli = cache.image('images/chilli/chilli.png', scale = 1.25)
+		self.collect_image = cache.text(main_font, '+100', False, COLOURS['light_yellow'], COLOURS['black'])
 
 		self.image = self.chilli
-		self.rect = self.image.get_rect(center = (WIDTH + 50, y_offset))
-		self.pos = pygame.math.Vector2(self.rect.center)
+		self.mask = cache.mask(self.image)
+		self.rect = self.image.get_rect()
 
 		self.SFX: ChilliSFXDict = self.game.SFX['chilli']
 		self.SFX['collect'].set_volume(5 * VOLUMES['sfx'])
 
-		self.speed = speed
 		self.collected = False
 
-	def update(self, dt: float) -> None:
+	def spawn(self, y_offset: int) -> None:
 
-		self.rect.center = (round(self.pos.x), round(self.pos.y))
-		self.scroll(dt)
-		if not self.collected: self.check_collision()
+		# (re)used from the pool - may still be showing '+100' from its last run
+		self.image = self.chilli
+		self.mask = cache.mask(self.image)
+		self.rect.size = self.image.get_size()
+		self.rect.center = (WIDTH + self.OFFSET, y_offset)
+		self.collected = False
 
-	def scroll(self, dt: float) -> None:
+	def place(self, x: float) -> None:
+		self.rect.centerx = round(x + self.OFFSET)
 
-		self.pos.x -= self.speed * dt
-		if self.pos.x + (self.image.get_width() / 2) <= 0: self.kill()
+	def collect(self) -> None:
 
-	def check_collision(self) -> None:
+		self.game.chilli_collected()
+		self.SFX['collect'].play()
+		self.show_collected()
 
-		if pygame.sprite.collide_rect(self, self.game.player.sprite): 
-			
-			self.collected = True
-			self.game.chilli_collected()
-			self.SFX['collect'].play()
-			self.image = self.collect
-			self.rect = self.image.get_rect(center = self.pos)
+	def show_collected(self) -> None:
+
+		self.collected = True
+		self.image = self.collect_image
+		self.mask = cache.mask(self.image)
+		centre = self.rect.center
+		self.rect.size = self.image.get_size()
+		self.rect.center = centre
 
 class Background(pygame.sprite.Sprite):
 
@@ -646,42 +1068,55 @@ class Background(pygame.sprite.Sprite):
 
 		super().__init__()
 
-		self.image = pygame.image.load(assets.resource_path('images/background/stars.png')).convert_alpha()
-		self.image = pygame.transform.scale(self.image, (WIDTH, HEIGHT))
+		self.image = cache.image('images/background/stars.png', scale = (WIDTH, HEIGHT))
 		self.rect = self.image.get_rect(center = (x_pos, CENTRE_Y))
 		self.pos = pygame.math.Vector2(self.rect.center)
+		self.previous_x = self.pos.x
 
 		self.SPEED = 100
 
 	def update(self, dt: float) -> None:
 
 		self.rect.center = (round(self.pos.x), round(self.pos.y))
+		self.previous_x = self.pos.x
 		self.scroll(dt)
 
+	def interpolate(self, alpha: float) -> None:
+		self.rect.center = (round(self.previous_x + (self.pos.x - self.previous_x) * alpha), round(self.pos.y))
+
 	def scroll(self, dt: float) -> None:
 
 		self.pos.x -= self.SPEED * dt
-		if self.pos.x <= 0 - WIDTH / 2: self.pos.x = WIDTH + WIDTH / 2
+
+		if self.pos.x <= 0 - WIDTH / 2: 
+			self.previous_x += (WIDTH + WIDTH / 2) - self.pos.x # keep interpolation continuous across the wrap
+			self.pos.x = WIDTH + WIDTH / 2
 
 class Button(pygame.sprite.Sprite):
 
+	# 'float' animations snap to the nearest pre-rendered scale level
+	SCALE_STEP = 0.02
+
 	def __init__(self, type: str, pos: tuple, animation_type: str, animation_offset: int | float, press_state: Literal[0, 1, 2, 3, 4, 'next-costume', 'last-costume', 'unpause'], game: Game) -> None:
 
 		super().__init__()
 		self.game = game
 
-		self.default = pygame.image.load(assets.resource_path(f'images/button/{type}/{type}.png')).convert_alpha()
+		self.default = cache.image(f'images/button/{type}/{type}.png')
 
 		if animation_type == 'slide':
 
-			self.select = pygame.image.load(assets.resource_path(f'images/button/{type}/{type}-select.png')).convert_alpha()
+			self.select = cache.image(f'images/button/{type}/{type}-select.png')
 			self.frames = [self.default, self.select]
 			self.state = 0
 			self.image = self.frames[self.state]
 
 		if animation_type == 'float':
 
-			self.image = self.default
+			# shared between every button of the same type via the asset cache
+			self.scale_frames = [cache.image(f'images/button/{type}/{type}.png', scale = scale) for scale in self.scale_levels(animation_offset)]
+			self.scale_frame = 0
+			self.image = self.scale_frames[self.scale_frame]
 			self.scale = 1.0
 
 		self.rect = self.image.get_rect(center = pos)
@@ -698,6 +1133,12 @@ class Button(pygame.sprite.Sprite):
 		self.pressing = False
 		self.ANIMATION_SPEED = 20
 
+	@ classmethod
+	def scale_levels(cls, animation_offset: float) -> list[float]:
+
+		# every scale a 'float' animation of this offset snaps to
+		return [round(1 + level * cls.SCALE_STEP, 3) for level in range(round(animation_offset / cls.SCALE_STEP) + 1)]
+
 	def update(self, dt: float) -> None:
 
 		if self.animation_type == 'slide': self.image = self.frames[self.state]
@@ -735,16 +1176,18 @@ class Button(pygame.sprite.Sprite):
 
 		if type == 'float':
 			
-			if dir == 'out': 
-				
-				self.scale += (self.ANIMATION_SPEED * dt) * ((1 + self.animation_offset) - self.scale)
-				self.image = pygame.transform.scale_by(self.default, self.scale)
-				self.rect = self.image.get_rect(center = self.pos)
+			target = 1 + self.animation_offset if dir == 'out' else 1.0
+			if self.scale == target: return # settled; nothing to rescale
 
-			if dir == 'in': 
-				
-				self.scale += (self.ANIMATION_SPEED * dt) * (1 - self.scale)
-				self.image = pygame.transform.scale_by(self.default, self.scale)
+			self.scale += (self.ANIMATION_SPEED * dt) * (target - self.scale)
+			if abs(target - self.scale) < self.SCALE_STEP / 2: self.scale = target
+
+			scale_frame = min(max(round((self.scale - 1) / self.SCALE_STEP), 0), len(self.scale_frames) - 1)
+
+			if scale_frame != self.scale_frame:
+
+				self.scale_frame = scale_frame
+				self.image = self.scale_frames[self.scale_frame]
 				self.rect = self.image.get_rect(center = self.pos)
 
 	def pressed(self) -> None:
@@ -775,7 +1218,12 @@ class Button(pygame.sprite.Sprite):
 
 		self.pos = pygame.math.Vector2(self.start_pos)
 		if self.animation_type == 'slide': self.state = 0
-		if self.animation_type == 'float': self.scale = 1
+		if self.animation_type == 'float': 
+			
+			self.scale = 1.0
+			self.scale_frame = 0
+			self.image = self.scale_frames[self.scale_frame]
+			self.rect = self.image.get_rect(center = self.pos)
 
 class IntroSprite(pygame.sprite.Sprite):
 
@@ -789,46 +1237,86 @@ class IntroSprite(pygame.sprite.Sprite):
 		
 		if type == 'rays':
 
-			self.og_image = pygame.image.load(assets.resource_path('images/intro-sprite/god-rays.png')).convert_alpha()
-			self.og_image = pygame.transform.scale_by(self.og_image, 0.75).convert_alpha()
+			self.og_image = cache.image('images/intro-sprite/god-rays.png', scale = 0.75)
 			self.image = self.og_image
 			self.rect = self.image.get_rect(center = pos)
-			self.rotation = 0
+			self.rotation = 0.0
 			self.rotation_speed = 50
+			self.rotation_table: asset_cache.RotationTable | None = None # shared; fetched the first time the sprite turns, so never headless
 
 		if type == 'taco':
 
 			self.frame_vel = 2
 			self.SCALE = 1.5
-			self.normal = pygame.transform.scale_by(self.game.player.sprite.images[self.game.player.sprite.image_index], self.SCALE).convert_alpha()
-			self.large = pygame.transform.scale_by(self.normal, 1.3).convert_alpha()
-			self.frames = [self.normal, self.large]
+			self.costume_frames: dict[int, list[pygame.surface.Surface]] = {} # costume index -> [normal, large]; built on first use
+			self.costume = self.game.player.sprite.image_index
+			self.frames = self.get_costume_frames(self.costume)
 			self.frame_index = 0.0
 			self.image = self.frames[int(self.frame_index)]
-			self.rect = self.image.get_rect(center = self.pos)
+			self.rect = self.image.get_rect(center = (self.pos[0], self.pos[1] - 15))
 	
 	def update(self, dt: float) -> None:
 
 		if self.type == 'taco': self.animate(dt)
+		if self.type == 'rays': self.rotate(dt)
+
+	@ staticmethod
+	def visible_window(pos: tuple[int, int]) -> pygame.rect.Rect:
+
+		# the part of the screen a sprite centred at pos can cover, relative to its centre
+		return pygame.rect.Rect(-pos[0], -pos[1], WIDTH, HEIGHT)
+
+	def rotate(self, dt: float) -> None:
+
+		if self.rotation_table is None: self.rotation_table = cache.rotation_table('images/intro-sprite/god-rays.png', scale = 0.75, window = self.game.rays_window)
+
+		self.rotation = (self.rotation + self.rotation_speed * dt) % 360
+		frame = self.rotation_table.frame(self.rotation)
+
+		if frame is not None and frame is not self.image:
+			self.image = frame
+			self.rect = self.rotation_table.window.move(self.pos)
+
+	def get_costume_frames(self, costume: int) -> list[pygame.surface.Surface]:
+
+		frames = self.costume_frames.get(costume)
+
+		if frames is None:
+
+			normal = pygame.transform.scale_by(self.game.player.sprite.images[costume], self.SCALE).convert_alpha()
+			large = pygame.transform.scale_by(normal, 1.3).convert_alpha()
+			frames = self.costume_frames[costume] = [normal, large]
+
+		return frames
 
 	def animate(self, dt: float) -> None:
 
-		self.normal = pygame.transform.scale_by(self.game.player.sprite.images[self.game.player.sprite.image_index], self.SCALE).convert_alpha()
-		self.large = pygame.transform.scale_by(self.normal, 1.3).convert_alpha()
-		self.frames = [self.normal, self.large]
+		# frames only change when the costume does
+		if self.game.player.sprite.image_index != self.costume:
+			self.costume = self.game.player.sprite.image_index
+			self.frames = self.get_costume_frames(self.costume)
+
 		self.frame_index = self.frame_index + (self.frame_vel * dt)
 		self.frame_index %= len(self.frames)
-		self.image = self.frames[int(self.frame_index)]
-		self.rect = self.image.get_rect(center = (self.pos[0], self.pos[1] - 15))
+		image = self.frames[int(self.frame_index)]
 
-	def reset(self) -> None:
+		if image is not self.image:
+			self.image = image
+			self.rect = self.image.get_rect(center = (self.pos[0], self.pos[1] - 15))
 
-		self.rect = self.image.get_rect(center = self.pos)
+	def reset(self) -> None:
 
 		if self.type == 'taco':
 			
 			self.frame_index = 0
 			self.image = self.frames[self.frame_index]
+			self.rect = self.image.get_rect(center = (self.pos[0], self.pos[1] - 15))
+
+		elif self.rotation_table is not None and self.image is not self.og_image:
+			self.rect = self.rotation_table.window.move(self.pos)
+
+		else:
+			self.rect = self.image.get_rect(center = self.pos)
 
 class MenuBackground(pygame.sprite.Sprite):
 
@@ -836,8 +1324,7 @@ class MenuBackground(pygame.sprite.Sprite):
 
 		super().__init__()
 
-		self.image = pygame.image.load(assets.resource_path('images/game-over-menu/game-over-menu.png')).convert_alpha()
-		self.image = pygame.transform.scale_by(self.image, 0.3)
+		self.image = cache.image('images/game-over-menu/game-over-menu.png', scale = 0.3)
 		self.rect = self.image.get_rect(midbottom = pos)
 		self.pos = pygame.math.Vector2(self.rect.center)
 
@@ -856,11 +1343,56 @@ class MenuBackground(pygame.sprite.Sprite):
 	def reset(self) -> None:
 		self.pos = pygame.math.Vector2(self.start_pos)
 
+# Asset Loading - main() has every asset decoded + scaled on worker threads, the menu's first, and waits for
+# all of them behind the splash before Game() takes them from the cache. Headless runs never queue any.
+def button_images(type: str, float_offset: float | None = None) -> list[asset_cache.ImageSpec]:
+
+	# every frame a Button of this type uses
+	scales = Button.scale_levels(float_offset) if float_offset else [1.0]
+	return [(f'images/button/{type}/{type}.png', scale, 0.0) for scale in scales]
+
+loader = asset_cache.AssetLoader(cache)
+
+def load_assets() -> list[Future]:
+
+	# queues every asset; returns the menu's jobs, which go first - play's follow, then the other scenes'
+	first_scene = loader.sounds(['audio/music/raining-tacos.mp3', 'audio/sfx/button/click.wav']) + loader.images([(f'images/player/taco{i}.png', 0.3, 0.0) for i in range(7)], masks = True) + loader.images([
+		('images/background/stars.png', (WIDTH, HEIGHT), 0.0),
+		('images/intro-sprite/god-rays.png', 0.75, 0.0),
+		('images/text/flappy.png', 0.25, 0.0),
+		('images/text/taco!.png', 0.4, 0.0),
+		*button_images('play'), ('images/button/play/play-select.png', 1.0, 0.0),
+		*button_images('choose-taco'), ('images/button/choose-taco/choose-taco-select.png', 1.0, 0.0),
+		*button_images('help', 0.2)
+	])
+
+	loader.images([('images/fork/fork.png', 1.5, 0.0), ('images/fork/fork.png', 1.5, 180.0), ('images/chilli/chilli.png', 1.25, 0.0)], masks = True)
+	loader.sounds(['audio/sfx/chilli/collect.mp3', 'audio/sfx/player/death.mp3', 'audio/sfx/player/jump.wav'])
+	loader.images([
+		('images/text/help.png', (WIDTH, HEIGHT), 0.0),
+		('images/text/game-over.png', 0.25, 0.0),
+		('images/text/paused.png', 0.3, 0.0),
+		('images/text/choose-costume.png', 0.3, 0.0),
+		*[(f'images/player/taco{i}.png', Player.PREVIEW_SCALE, 0.0) for i in range(7)],
+		('images/game-over-menu/game-over-menu.png', 0.3, 0.0),
+		*button_images('ok!', 0.2), *button_images('arrow-left', 0.4), *button_images('arrow-right', 0.4),
+		*button_images('try-again', 0.2), *button_images('main-menu', 0.2), *button_images('resume', 0.2)
+	])
+
+	return first_scene
+
 def main() -> None:
 
-	start_time = time()
+	start_time = perf_counter()
+
+	# the splash shows how far loading has got and keeps pumping events until the menu has every asset it builds from;
+	# the other scenes keep loading behind it and are built the first time they're entered
+	first_scene = load_assets()
+	loader.wait(first_scene, on_progress = show_loading_progress)
+	logger.info(f'first scene assets loaded in {round(perf_counter() - start_time, 3)}s')
 
 	game = Game(user_data = USER_DATA)
+	loader.shutdown()
 	text = game.text
 	player = game.player
 	forks = game.forks
@@ -870,15 +1402,18 @@ def main() -> None:
 	choose_taco_sprites = game.choose_taco_sprites
 	game_over_sprites = game.game_over_sprites
 	pause_sprites = game.pause_sprites
+	renderer = rendering.Renderer(screen, fill_colour = COLOURS['black'])
 
-	logger.info(f'game initialised in {round(time() - start_time, 3)}s')
+	logger.info(f'game initialised in {round(perf_counter() - start_time, 3)}s')
 	pygame.display.set_caption('Flappy Taco')
-	previous_time = time()
+	previous_time = perf_counter()
+	accumulator = 0.0
 
 	while True:
 
-		dt = time() - previous_time
-		previous_time = time()
+		now = perf_counter()
+		dt = now - previous_time
+		previous_time = now
 		
 		for event in pygame.event.get():
 
@@ -889,6 +1424,9 @@ def main() -> None:
 					logger.info('pygame.QUIT event detected')
 					game.quit()
 
+				case pygame.WINDOWEXPOSED:
+					renderer.invalidate()
+
 				case pygame.MOUSEBUTTONDOWN:
 
 					logger.info('[LEFT MOUSE BUTTON] pressed')
@@ -919,39 +1457,25 @@ def main() -> None:
 						elif game.state == game.STATES['menu']:
 							game.quit()
 
-				case game.FORK_TIMER:
-
-					if game.state == game.STATES['play'] and game.started and not game.paused:
-						
-						y_offset = randint(int(HEIGHT / 3), int(HEIGHT - HEIGHT / 3))
-
-						forks.add(
-							Fork(orientation = 'up', speed = game._FORK_SPEED, offset = y_offset, game = game), 
-							Fork(orientation = 'down', speed = game._FORK_SPEED, offset = y_offset, game = game)
-						)
-
-						if randint(0, game.CHILLI_FREQUENCY) == 0: 
-							chillies.add(Chilli(speed = game._FORK_SPEED, y_offset = y_offset, game = game))
-
 		# Background
-		screen.fill(COLOURS['black'])
-		background.draw(screen)
+		running = game.state == game.STATES['play'] and game.started and not game.paused
+		if not running: accumulator = 0.0 # never catch up on time spent outside of play
+		renderer.begin(background, scrolling = running)
 
 		if game.state == game.STATES['menu']:
 
 			# Intro Sprites
 			menu_sprites.update(dt)
-			menu_sprites.draw(screen)
+			renderer.draw(menu_sprites)
 
 		elif game.state == game.STATES['choose_taco']:
 
 			# Choose Taco Sprites
 			choose_taco_sprites.update(dt)
-			choose_taco_sprites.draw(screen)
+			renderer.draw(choose_taco_sprites)
 
 			# Player
-			player.sprite.costume_display()
-			player.draw(screen)
+			renderer.blit(*player.sprite.costume_display())
 
 		elif game.state == game.STATES['play']:
 
@@ -959,67 +1483,77 @@ def main() -> None:
 			
 				if not game.paused:
 
-					# Background
-					background.update(dt)
+					# Simulation - fixed ticks, then draw between the last two
+					accumulator += dt
+					ticks = 0
+
+					while accumulator >= game.TICK and game.state == game.STATES['play']:
+
+						game.step(game.TICK)
+						accumulator -= game.TICK
+						ticks += 1
+
+						if ticks >= game.MAX_CATCH_UP_TICKS: 
+							accumulator %= game.TICK
+							break
+
+					game.interpolate(min(accumulator / game.TICK, 1.0))
 
 					# Forks
-					forks.update(dt)
-					forks.draw(screen)
+					renderer.draw(forks)
 
 					# Chillies
-					chillies.update(dt)
-					chillies.draw(screen)
+					renderer.draw(chillies)
 
 					# Player
-					player.draw(screen)
-					player.update(dt)
+					renderer.draw(player)
 				
 				elif game.paused:
 
 					# Player
-					player.draw(screen)
+					renderer.draw(player)
 
 					# Forks
-					forks.draw(screen)
+					renderer.draw(forks)
 
 					# Chillies
-					chillies.draw(screen)
+					renderer.draw(chillies)
 
 					# Pause Sprites
 					pause_sprites.update(dt)
-					pause_sprites.draw(screen)
+					renderer.draw(pause_sprites)
 			
 			elif not game.started:
 
 				# Player
-				player.draw(screen)
+				renderer.draw(player)
 
 				# Forks
-				forks.draw(screen)
+				renderer.draw(forks)
 
 				# Chillies
-				chillies.draw(screen)
+				renderer.draw(chillies)
 
 		elif game.state == game.STATES['over']:
 
 				# Player
-				player.draw(screen)
+				renderer.draw(player)
 
 				# Forks
-				forks.draw(screen)
+				renderer.draw(forks)
 
 				# Chillies
-				chillies.draw(screen)
+				renderer.draw(chillies)
 
 				# Game Over Sprites
 				game_over_sprites.update(dt)
-				game_over_sprites.draw(screen)
+				renderer.draw(game_over_sprites)
 
 		# Text
 		text.update()
-		[screen.blit(line[0], line[1]) for line in text.texts]
+		for surface, rect in text.texts: renderer.blit(surface, rect)
 
-		pygame.display.update()
+		renderer.present()
 		clock.tick(0 if VSYNC else FPS)
 
 if __name__ == '__main__': main()
\ No newline at end of file
@@ -0,0 +1,105 @@
+import weakref
+from typing import Iterable
+
+import numpy as np
+import pygame
+
+import logs
+
+logger = logs.get_logger(file = __file__) # get logger
+
+class PixelRenderer:
+
+	'''
+	Draws sprite groups straight into a small offscreen surface.
+
+	Nothing is drawn at full resolution and scaled down afterwards: every
+	sprite image is scaled (and greyed) once, the first time it is seen,
+	and blitted at its scaled position from then on, so a frame costs a
+	handful of tiny blits. pixels() hands the result back as a NumPy view
+	of the surface's own memory - no copy, no readback of the screen.
+	'''
+
+	def __init__(self, size: tuple[int, int] = (84, 84), source_size: tuple[int, int] = (1000, 750), grayscale: bool = True, fill_colour: str | tuple[int, int, int] = 'black') -> None:
+
+		self.size = size
+		self.grayscale = grayscale
+		self.fill_colour = fill_colour
+		self.scale = (size[0] / source_size[0], size[1] / source_size[1])
+
+		# 32 bit like the sprites, so their alpha blends exactly as on screen; works without a display
+		self.surface = pygame.surface.Surface(size, pygame.SRCALPHA, 32)
+		self._scaled: weakref.WeakKeyDictionary[pygame.surface.Surface, pygame.surface.Surface] = weakref.WeakKeyDictionary()
+
+	@ property
+	def shape(self) -> tuple[int, ...]:
+
+		# (height, width) greyscale or (height, width, 3) colour, as pixels() returns them
+		width, height = self.size
+		return (height, width) if self.grayscale else (height, width, 3)
+
+	def _scaled_image(self, image: pygame.surface.Surface) -> pygame.surface.Surface:
+
+		scaled = self._scaled.get(image)
+
+		if scaled is None:
+
+			width, height = image.get_size()
+			size = (max(1, round(width * self.scale[0])), max(1, round(height * self.scale[1])))
+			scaled = pygame.transform.smoothscale(image, size) if image.get_bitsize() >= 24 else pygame.transform.scale(image, size) # smoothscale needs 24/32 bit
+			if self.grayscale: scaled = pygame.transform.grayscale(scaled)
+			self._scaled[image] = scaled
+
+		return scaled
+
+	def render(self, groups: Iterable[Iterable[pygame.sprite.Sprite]], blits: Iterable[tuple[pygame.surface.Surface, pygame.rect.Rect]] = ()) -> None:
+
+		# groups are drawn in order, then any extra (surface, rect) blits; positions are in source pixels
+		surface = self.surface
+		scale_x, scale_y = self.scale
+		surface.fill(self.fill_colour)
+
+		for group in groups:
+			for sprite in group: surface.blit(self._scaled_image(sprite.image), (int(sprite.rect.x * scale_x), int(sprite.rect.y * scale_y)))
+
+		for image, rect in blits: surface.blit(self._scaled_image(image), (int(rect.x * scale_x), int(rect.y * scale_y)))
+
+	def pixels(self) -> np.ndarray:
+
+		# zero-copy view, rows first: greyscale (h, w) is the red channel - equal to green + blue once greyed
+		# the view locks the surface; let go of it before the next render()
+		if self.grayscale: return pygame.surfarray.pixels_red(self.surface).T
+		return pygame.surfarray.pixels3d(self.surface).swapaxes(0, 1)
+
+class FrameStack:
+
+	'''
+	The last `depth` frames, oldest first, in a preallocated ring buffer.
+
+	Every frame is written twice, `depth` rows apart, so the newest `depth`
+	frames always sit next to each other and stacked() is a plain slice -
+	no reordering copy however far round the ring has turned.
+	'''
+
+	def __init__(self, depth: int, shape: tuple[int, ...], dtype: np.dtype | type = np.uint8) -> None:
+
+		self.depth = depth
+		self.buffer = np.zeros((2 * depth, *shape), dtype = dtype)
+		self.index = 0 # next slot to write
+
+	def reset(self, frame: np.ndarray) -> None:
+
+		# a fresh episode starts with its first frame repeated
+		self.buffer[:] = frame
+		self.index = 0
+
+	def push(self, frame: np.ndarray) -> None:
+
+		self.buffer[self.index] = frame
+		self.buffer[self.index + self.depth] = frame
+		self.index = (self.index + 1) % self.depth
+
+	def stacked(self) -> np.ndarray:
+
+		# view of (depth, *shape); it changes with the next push()
+		return self.buffer[self.index:self.index + self.depth]
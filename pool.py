@@ -0,0 +1,48 @@
+from typing import Callable, Generic, TypeVar
+
+import logs
+
+logger = logs.get_logger(file = __file__) # get logger
+
+T = TypeVar('T')
+
+class Pool(Generic[T]):
+
+	'''
+	Free list of reusable objects.
+
+	acquire() hands back a released object when there is one (a hit) and only
+	calls `factory` when the free list is empty (a miss). Objects are handed
+	back as they were released - whoever acquires one re-initialises it.
+	Pre-warm to the most objects ever alive at once and steady-state use
+	never allocates.
+	'''
+
+	def __init__(self, factory: Callable[[], T], name: str) -> None:
+
+		self.factory = factory
+		self.name = name
+		self.hits = 0
+		self.misses = 0
+		self._free: list[T] = []
+
+	def __len__(self) -> int:
+		return len(self._free)
+
+	def prewarm(self, count: int) -> None:
+
+		for _ in range(count - len(self._free)): self._free.append(self.factory())
+		logger.info(f'{self.name} pool pre-warmed with {len(self._free)} objects')
+
+	def acquire(self) -> T:
+
+		if self._free:
+
+			self.hits += 1
+			return self._free.pop()
+
+		self.misses += 1
+		return self.factory()
+
+	def release(self, item: T) -> None:
+		self._free.append(item)
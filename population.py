@@ -0,0 +1,231 @@
+import argparse
+from time import perf_counter
+from typing import Callable, TypedDict
+
+import numpy as np
+
+import headless
+import logs
+import main
+
+logger = logs.get_logger(file = __file__) # get logger
+
+# Policies - decide for every player at once whether it holds jump on this tick
+Policy = Callable[['Population'], np.ndarray]
+
+class PopulationResultDict(TypedDict):
+	seed: int
+	ticks: int
+	scores: np.ndarray
+	survival_times: np.ndarray
+	chillies: np.ndarray
+	death_causes: np.ndarray
+
+class ThresholdPolicy:
+
+	'''
+	heuristic_pilot with a margin per player: hold jump while more than
+	margin px below the next gap's centre and falling. A population flying
+	this with a spread of margins evaluates every margin in one run.
+	'''
+
+	def __init__(self, margins: np.ndarray) -> None:
+		self.margins = margins
+
+	def __call__(self, population: 'Population') -> np.ndarray:
+
+		target = population.game.next_gap()
+		if target is None: target = main.CENTRE_Y
+
+		return (population.y > target + self.margins) & (population.y_vel > 0)
+
+class Population:
+
+	'''
+	N tacos flying against one shared obstacle stream.
+
+	Every player's state lives in NumPy arrays and each tick runs the same
+	rules as Game.step + Player.update - input, jump, swept death checks,
+	gravity, chilli pickup and scoring - as batched array operations over
+	the whole population. Players never interact: each one flies exactly
+	the round a single player would with the same seed and inputs. Dead
+	players stay frozen where they died.
+
+	The obstacle world, spawner and fork pairs are the game's own; the
+	game's player sprite stands in as the shape (mask + opaque bounds) of
+	every taco, so the population flies its current costume.
+	'''
+
+	# death causes
+	ALIVE = 0
+	FORK = 1
+	OUT_OF_BOUNDS = 2
+	DEATH_CAUSES = ('', 'crashed into a Fork', 'went out of bounds')
+
+	def __init__(self, size: int, game: main.Game | None = None) -> None:
+
+		self.game = game or headless.HeadlessEngine().game
+		self.size = size
+		self.ticks = 0
+		self.culled = 0 # columns culled so far; row index + culled = the column's serial number this round
+
+		self.y = np.zeros(size, dtype = np.float64)
+		self.previous_y = np.zeros(size, dtype = np.float64)
+		self.y_vel = np.zeros(size, dtype = np.float64)
+		self.chilli_energy = np.zeros(size, dtype = np.int64)
+		self.jumping = np.zeros(size, dtype = np.bool_)
+		self.alive = np.zeros(size, dtype = np.bool_)
+		self.score = np.zeros(size, dtype = np.int64)
+		self.chillies = np.zeros(size, dtype = np.int64)
+		self.last_chilli = np.zeros(size, dtype = np.int64) # serial + 1 of the last column whose chilli was collected
+		self.death_tick = np.zeros(size, dtype = np.int64)
+		self.death_cause = np.zeros(size, dtype = np.uint8)
+
+	def reset(self, seed: int | None = None) -> None:
+
+		game = self.game
+		game.replay_path = None
+		game.restart(seed)
+		game.start()
+
+		player = game.player.sprite
+		self.ticks = 0
+		self.culled = 0
+		self.y[:] = self.previous_y[:] = player.pos.y
+		self.y_vel[:] = 0.0
+		self.chilli_energy[:] = player.MAX_CHILLI_ENERGY
+		self.jumping[:] = False
+		self.alive[:] = True
+		self.score[:] = 0
+		self.chillies[:] = 0
+		self.last_chilli[:] = 0
+		self.death_tick[:] = 0
+		self.death_cause[:] = self.ALIVE
+
+	def step(self, actions: np.ndarray) -> None:
+
+		# one fixed tick for every player - the order matches Game.step
+		game = self.game
+		player = game.player.sprite
+		obstacles = game.world
+		dt = game.TICK
+		alive = self.alive.copy() # flying at the start of the tick; a taco that dies still finishes it, as in Game.step
+
+		# Player.update - input + jump on the press edge only
+		np.minimum(self.chilli_energy, player.MAX_CHILLI_ENERGY, out = self.chilli_energy)
+		pressed = actions & alive
+		jump = pressed & ~self.jumping & (self.chilli_energy > 0)
+		self.jumping = pressed
+		np.copyto(self.y_vel, -player.JUMP_BOOST, where = jump)
+		np.subtract(self.chilli_energy, player.JUMP_COST, out = self.chilli_energy, where = jump)
+
+		# death checks - out of bounds wins over a crash on the same tick, as in Player.check_death
+		half_height = player.rect.height // 2
+		out_of_bounds = alive & ((self.y <= player.image.get_height() / 2) | (self.y >= main.HEIGHT - player.image.get_height() / 2))
+		crashed = np.zeros(self.size, dtype = np.bool_)
+		flying = alive & ~out_of_bounds
+
+		# swept from where the last tick started
+		start_top = np.round(self.previous_y).astype(np.int64) - half_height
+		end_top = np.round(self.y).astype(np.int64) - half_height
+
+		for index in obstacles.overlapping(player.rect.left - obstacles.scrolled, player.rect.right):
+
+			pair: main.ForkPair = obstacles.payloads[index][0]
+			start_x, end_x = float(obstacles.previous_x[index]), float(obstacles.x[index])
+			pair.place(end_x)
+
+			# the interval test clears everyone flying through the gap; only the rest get ForkPair.hit's mask tests,
+			# once per distinct sweep - tacos flying alike share the same few tops
+			inside = (np.minimum(start_top, end_top) + player.opaque.top >= pair.up.tips) & (np.maximum(start_top, end_top) + player.opaque.bottom <= pair.down.tips)
+			tested = np.flatnonzero(flying & ~inside & ~crashed)
+			if not tested.size: continue
+
+			sweeps, which = np.unique(np.stack((start_top[tested], end_top[tested]), axis = 1), axis = 0, return_inverse = True)
+			hits = np.array([pair.hit(player, start_x, end_x, start, end) for start, end in sweeps.tolist()], dtype = np.bool_)
+			crashed[tested] = hits[which.ravel()]
+
+		self.death_cause[crashed] = self.FORK
+		self.death_cause[out_of_bounds] = self.OUT_OF_BOUNDS
+		died = crashed | out_of_bounds
+		self.death_tick[died] = self.ticks + 1 # ticks flown, counting this one - as HeadlessEngine.run_round counts them
+		self.alive &= ~died
+
+		# Player.fall - ufunc where= keeps the dead frozen without gathering + scattering through a mask
+		np.copyto(self.previous_y, self.y, where = alive)
+		np.add(self.y, self.y_vel * dt, out = self.y, where = alive)
+		np.add(self.y_vel, player.GRAVITY * dt, out = self.y_vel, where = alive)
+
+		# chillies - picked up against the rect from before the fall, once per player per column
+		left, width = player.rect.left, player.rect.width
+
+		for index in obstacles.chilli_span(left, left + width):
+
+			if not obstacles.kind[index] & obstacles.CHILLI: continue
+
+			serial = self.culled + index + 1
+			touching = alive & (self.last_chilli < serial) & (np.abs(obstacles.y[index] - (end_top + player.rect.height / 2)) < (obstacles.chilli_height + player.rect.height) / 2)
+			self.last_chilli[touching] = serial
+			self.chillies[touching] += 1
+			self.chilli_energy[touching] += 200
+
+		# obstacles - shared by everyone
+		distance = game._FORK_SPEED * dt
+		for overshoot, column in game.spawner.advance(distance): game.spawn_forks(main.WIDTH + distance - overshoot, column)
+		obstacles.scroll(distance)
+
+		culled = obstacles.cull()
+		self.culled += len(culled)
+		game.release_obstacles(culled)
+
+		passed = obstacles.update_passed(player.pos.x)
+		if passed: self.score[alive] += passed
+
+		self.ticks += 1
+
+	def run(self, policy: Policy, max_ticks: int = 120 * main.Game.TICK_RATE, seed: int | None = None) -> PopulationResultDict:
+
+		self.reset(seed)
+
+		while self.ticks < max_ticks and self.alive.any():
+			self.step(policy(self))
+
+		survival_ticks = np.where(self.alive, self.ticks, self.death_tick)
+
+		return {
+			'seed': self.game.seed,
+			'ticks': self.ticks,
+			'scores': self.score.copy(),
+			'survival_times': survival_ticks * self.game.TICK,
+			'chillies': self.chillies.copy(),
+			'death_causes': self.death_cause.copy()
+		}
+
+def init() -> None:
+
+	parser = argparse.ArgumentParser(description = 'Fly a whole population of heuristic pilots with different margins against one obstacle stream.')
+	parser.add_argument('--size', type = int, default = 10000)
+	parser.add_argument('--max-seconds', type = float, default = 60.0, help = 'simulated seconds before the round is cut off')
+	parser.add_argument('--seed', type = int)
+	parser.add_argument('--margins', type = float, nargs = 2, default = (-60.0, 120.0), metavar = ('LOW', 'HIGH'), help = 'range the pilots\' margins are spread over')
+	args = parser.parse_args()
+
+	population = Population(args.size)
+	margins = np.linspace(*args.margins, args.size)
+
+	start_time = perf_counter()
+	result = population.run(ThresholdPolicy(margins), max_ticks = round(args.max_seconds * main.Game.TICK_RATE), seed = args.seed)
+	elapsed = perf_counter() - start_time
+
+	best = int(np.argmax(result['scores']))
+	simulated = result['ticks'] * main.Game.TICK
+	summary = (
+		f'{args.size} players, {result["ticks"]} ticks ({round(simulated, 2)}s simulated) in {round(elapsed, 2)}s - '
+		f'{round(simulated / elapsed, 1)}x real time, {round(args.size * result["ticks"] / elapsed)} player-ticks/s; '
+		f'mean score {round(float(result["scores"].mean()), 2)}, best score {result["scores"][best]} at margin {round(float(margins[best]), 1)}'
+	)
+
+	logger.info(summary)
+	print(summary)
+
+if __name__ == '__main__': init()
@@ -0,0 +1,137 @@
+import pygame
+
+import logs
+
+logger = logs.get_logger(file = __file__) # get logger
+
+DrawItem = tuple[pygame.surface.Surface, pygame.rect.Rect]
+
+class Renderer:
+
+	'''
+	Dirty-rect renderer for the main loop.
+
+	Each frame the scene is queued with begin() / draw() / blit() and written
+	out by present(). While the background is scrolling every pixel changes,
+	so the whole screen is redrawn and presented. Otherwise the composed
+	background is cached and only the regions whose contents changed since
+	the last frame are restored, redrawn and passed to pygame.display.update.
+	'''
+
+	# past this fraction of the screen being dirty a full redraw is cheaper
+	_MAX_DIRTY_FRACTION = 0.5
+
+	def __init__(self, screen: pygame.surface.Surface, fill_colour: str | tuple[int, int, int]) -> None:
+
+		self.screen = screen
+		self.fill_colour = fill_colour
+		self.screen_rect = screen.get_rect()
+
+		self._background_layer = pygame.surface.Surface(self.screen_rect.size).convert()
+		self._background: pygame.sprite.Group = pygame.sprite.Group()
+		self._background_items: list[DrawItem] = []
+		self._cached_background: list[DrawItem] = []
+		self._scrolling = False
+		self._full_redraw = True
+
+		self._queue: list[DrawItem] = []
+		self._drawn: list[DrawItem] = []
+
+	def invalidate(self) -> None:
+
+		# force the next frame to redraw + present the whole screen
+		self._full_redraw = True
+
+	def begin(self, background: pygame.sprite.Group, scrolling: bool) -> None:
+
+		# the background is captured at present(), after this frame's simulation has placed it
+		self._background = background
+		self._scrolling = scrolling
+		self._queue = []
+
+	# items are queued with the area their blit really covers - a sprite's image may be bigger than its rect
+	def draw(self, group: pygame.sprite.AbstractGroup) -> None:
+		for sprite in group: self._queue.append((sprite.image, sprite.image.get_rect(topleft = sprite.rect.topleft)))
+
+	def blit(self, surface: pygame.surface.Surface, rect: pygame.rect.Rect) -> None:
+		self._queue.append((surface, surface.get_rect(topleft = rect.topleft)))
+
+	def present(self) -> None:
+
+		self._background_items = [(sprite.image, sprite.rect.copy()) for sprite in self._background]
+
+		if self._scrolling:
+
+			self.screen.fill(self.fill_colour)
+			for surface, rect in self._background_items: self.screen.blit(surface, rect)
+			self._draw_all()
+
+			self._cached_background = []
+			self._full_redraw = True
+			return
+
+		if self._background_items != self._cached_background:
+
+			self._background_layer.fill(self.fill_colour)
+			for surface, rect in self._background_items: self._background_layer.blit(surface, rect)
+			self._cached_background = self._background_items
+			self._full_redraw = True
+
+		dirty = [] if self._full_redraw else self._dirty_rects()
+
+		if self._full_redraw or sum(rect.w * rect.h for rect in dirty) > self._MAX_DIRTY_FRACTION * self.screen_rect.w * self.screen_rect.h:
+
+			self.screen.blit(self._background_layer, (0, 0))
+			self._draw_all()
+			self._full_redraw = False
+			return
+
+		for region in dirty:
+
+			self.screen.set_clip(region)
+			self.screen.blit(self._background_layer, region, region)
+			for surface, rect in self._queue:
+				if region.colliderect(rect): self.screen.blit(surface, rect)
+
+		self.screen.set_clip(None)
+		if dirty: pygame.display.update(dirty)
+		self._drawn = self._queue
+
+	def _draw_all(self) -> None:
+
+		for surface, rect in self._queue: self.screen.blit(surface, rect)
+		pygame.display.update()
+		self._drawn = self._queue
+
+	def _dirty_rects(self) -> list[pygame.rect.Rect]:
+
+		# any item that differs from last frame's item in the same slot dirties both its old + new area
+		dirty: list[pygame.rect.Rect] = []
+
+		for index in range(max(len(self._queue), len(self._drawn))):
+
+			new = self._queue[index] if index < len(self._queue) else None
+			old = self._drawn[index] if index < len(self._drawn) else None
+			if new is not None and old is not None and new[0] is old[0] and new[1] == old[1]: continue
+
+			if old is not None: dirty.append(old[1].clip(self.screen_rect))
+			if new is not None: dirty.append(new[1].clip(self.screen_rect))
+
+		return self._merge([rect for rect in dirty if rect.w and rect.h])
+
+	def _merge(self, rects: list[pygame.rect.Rect]) -> list[pygame.rect.Rect]:
+
+		# union overlapping regions so no pixel is restored + redrawn twice
+		merged: list[pygame.rect.Rect] = []
+
+		for rect in rects:
+
+			index = rect.collidelist(merged)
+
+			while index != -1:
+				rect = rect.union(merged.pop(index))
+				index = rect.collidelist(merged)
+
+			merged.append(rect)
+
+		return merged
@@ -0,0 +1,141 @@
+import struct
+from typing import BinaryIO, Iterator, TypedDict
+
+import logs
+
+logger = logs.get_logger(file = __file__) # get logger
+
+# File layout (little endian)
+# header: magic b'FTRP', format version (u8), tick rate (u16), rng seed (u32), costume index (u8),
+#         tick count (u32; patched in when the writer closes, 0 if it never did)
+# body:   run lengths of identical per-tick inputs as unsigned LEB128 varints, alternating
+#         released / pressed and always starting with released (the first run may be 0)
+MAGIC = b'FTRP'
+VERSION = 1
+HEADER = struct.Struct('<4sBHIBI')
+TICKS = struct.Struct('<I') # the header's last field
+
+class ReplayHeaderDict(TypedDict):
+	tick_rate: int
+	seed: int
+	costume_index: int
+	ticks: int
+
+class ReplayWriter:
+
+	'''
+	Streams one round's per-tick jump input to a replay file.
+
+	Held and released ticks come in long runs, so only the length of each
+	run is stored; a round of a few minutes is typically a few hundred
+	bytes. Nothing but the current run is kept in memory.
+	'''
+
+	def __init__(self, file: BinaryIO, header: ReplayHeaderDict) -> None:
+
+		self.file = file
+		self.header = header
+		self.ticks = 0
+		self._pressed = False
+		self._run = 0
+
+		file.write(HEADER.pack(MAGIC, VERSION, header['tick_rate'], header['seed'], header['costume_index'], 0))
+
+	@ classmethod
+	def open(cls, path: str, header: ReplayHeaderDict) -> 'ReplayWriter':
+		return cls(open(path, 'wb'), header)
+
+	def write(self, pressed: bool) -> None:
+
+		if pressed != self._pressed:
+
+			self._write_varint(self._run)
+			self._pressed = pressed
+			self._run = 0
+
+		self._run += 1
+		self.ticks += 1
+
+	def _write_varint(self, value: int) -> None:
+
+		encoded = bytearray()
+
+		while value > 0x7f:
+			encoded.append(value & 0x7f | 0x80)
+			value >>= 7
+
+		encoded.append(value)
+		self.file.write(encoded)
+
+	def close(self) -> None:
+
+		if self.file.closed: return
+		if self._run: self._write_varint(self._run)
+
+		if self.file.seekable():
+			self.file.seek(HEADER.size - TICKS.size)
+			self.file.write(TICKS.pack(self.ticks))
+
+		self.header['ticks'] = self.ticks
+		self.file.close()
+		logger.info(f'replay recorded: {self.ticks} ticks, seed {self.header["seed"]}')
+
+	def __enter__(self) -> 'ReplayWriter':
+		return self
+
+	def __exit__(self, *_) -> None:
+		self.close()
+
+class ReplayReader:
+
+	'''
+	Streams a replay file back as one jump input per tick.
+
+	Iterating yields a bool per recorded tick, decoding runs as it goes so a
+	replay of any length is played back in constant memory.
+	'''
+
+	def __init__(self, file: BinaryIO) -> None:
+
+		self.file = file
+		magic, version, tick_rate, seed, costume_index, ticks = HEADER.unpack(file.read(HEADER.size))
+
+		if magic != MAGIC: raise ValueError('not a Flappy Taco replay file')
+		if version != VERSION: raise ValueError(f'unsupported replay format version {version}; expected {VERSION}')
+
+		self.header: ReplayHeaderDict = {'tick_rate': tick_rate, 'seed': seed, 'costume_index': costume_index, 'ticks': ticks}
+
+	@ classmethod
+	def open(cls, path: str) -> 'ReplayReader':
+		return cls(open(path, 'rb'))
+
+	def _read_varint(self) -> int | None:
+
+		value = shift = 0
+
+		while byte := self.file.read(1):
+
+			value |= (byte[0] & 0x7f) << shift
+			if not byte[0] & 0x80: return value
+			shift += 7
+
+		if shift: raise ValueError('replay file ends mid-run')
+		return None
+
+	def __iter__(self) -> Iterator[bool]:
+
+		pressed = False
+
+		while (run := self._read_varint()) is not None:
+
+			for _ in range(run): yield pressed
+			pressed = not pressed
+
+	def close(self) -> None:
+		self.file.close()
+
+	def __enter__(self) -> 'ReplayReader':
+		return self
+
+	def __exit__(self, *_) -> None:
+		self.close()
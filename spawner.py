@@ -0,0 +1,50 @@
+from collections import deque
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar('T')
+
+class SpawnScheduler(Generic[T]):
+
+	'''
+	Spawns obstacle columns by distance scrolled, not by wall-clock time.
+
+	A column is due every `spacing` px of scrolling. advance() is handed
+	each tick's scroll distance and returns the columns due within it,
+	each with how far past its spawn point the scroll has already gone, so
+	columns land exactly `spacing` apart whatever the tick or frame rate.
+	Column specs come from `generate` and are kept `lookahead` deep in a
+	queue ahead of time, so what is coming next can be inspected before it
+	spawns.
+	'''
+
+	def __init__(self, spacing: float, generate: Callable[[], T], lookahead: int = 8) -> None:
+
+		self.spacing = spacing
+		self.generate = generate
+		self.lookahead = max(lookahead, 1)
+		self.queue: deque[T] = deque()
+		self.reset()
+
+	def reset(self) -> None:
+
+		# the first column is due one spacing after the start
+		self.until_next = self.spacing
+		self.queue.clear()
+		self.fill()
+
+	def fill(self) -> None:
+		while len(self.queue) < self.lookahead: self.queue.append(self.generate())
+
+	def advance(self, distance: float) -> list[tuple[float, T]]:
+
+		# -> [(overshoot, spec)]: overshoot is how far this tick's scroll carried past the spawn point
+		due: list[tuple[float, T]] = []
+		self.until_next -= distance
+
+		while self.until_next <= 0:
+
+			due.append((-self.until_next, self.queue.popleft()))
+			self.until_next += self.spacing
+
+		if due: self.fill()
+		return due
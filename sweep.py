@@ -0,0 +1,200 @@
+import os
+import json
+import argparse
+import itertools
+import statistics
+from time import perf_counter
+from multiprocessing.synchronize import Event
+from typing import Callable, TypedDict
+
+import headless
+import logs
+import main
+import workers
+
+logger = logs.get_logger(file = __file__) # get logger
+
+# tunable constants -> whether they live on the Game or the Player
+PARAMETERS = {
+	'GRAVITY': 'player',
+	'JUMP_BOOST': 'player',
+	'JUMP_COST': 'player',
+	'MAX_CHILLI_ENERGY': 'player',
+	'_FORK_SPEED': 'game',
+	'_FORK_FREQUENCY': 'game',
+	'CHILLI_FREQUENCY': 'game'
+}
+
+class SweepTaskDict(TypedDict):
+	params: dict[str, int | float]
+	seeds: list[int]
+	max_ticks: int
+
+class DistributionDict(TypedDict):
+	mean: float
+	stdev: float
+	min: float
+	p10: float
+	median: float
+	p90: float
+	max: float
+
+class ConfigResultDict(TypedDict):
+	params: dict[str, int | float]
+	rounds: int
+	score: DistributionDict
+	survival_time: DistributionDict
+	death_causes: dict[str, int]
+	scores: list[int]
+	survival_times: list[float]
+
+# Worker state - one headless engine per process, built once by the pool initialiser
+_engine: headless.HeadlessEngine | None = None
+_pilot_factory: Callable[[int], headless.Pilot] = lambda max_ticks: headless.heuristic_pilot
+_defaults: dict[str, int | float] = {}
+_stopping: Event | None = None # set by the parent when the sweep is given up; queued tasks are skipped
+
+def parse_param(text: str) -> tuple[str, list[int | float]]:
+
+	# NAME=v1,v2,... or NAME=start:stop:step (stop inclusive)
+	name, _, values = text.partition('=')
+	if name not in PARAMETERS: raise argparse.ArgumentTypeError(f'unknown parameter "{name}"; expected one of {", ".join(PARAMETERS)}')
+
+	number = lambda value: float(value) if '.' in value else int(value)
+
+	if ':' in values:
+
+		start, stop, step = (number(value) for value in values.split(':'))
+		count = int(round((stop - start) / step)) + 1
+		return name, [start + index * step for index in range(count)]
+
+	return name, [number(value) for value in values.split(',')]
+
+def _owner(name: str) -> object:
+
+	assert _engine is not None
+	return _engine.game.player.sprite if PARAMETERS[name] == 'player' else _engine.game
+
+def _init_worker(pilot: str, jump_every: int, stopping: Event) -> None:
+
+	global _engine, _pilot_factory, _stopping
+
+	workers.ignore_interrupts()
+	_stopping = stopping
+	_engine = headless.HeadlessEngine()
+	if pilot == 'scripted': _pilot_factory = lambda max_ticks: headless.ScriptedPilot(range(0, max_ticks, jump_every))
+	for name in PARAMETERS: _defaults[name] = getattr(_owner(name), name)
+
+def _run_task(task: SweepTaskDict) -> tuple[dict[str, int | float], list[headless.RoundResultDict]]:
+
+	assert _engine is not None and _stopping is not None
+	if _stopping.is_set(): return task['params'], []
+
+	# every task starts from the shipped constants; restart() picks up the new fork spacing
+	for name, value in {**_defaults, **task['params']}.items(): setattr(_owner(name), name, value)
+
+	results = []
+
+	for seed in task['seeds']:
+		_engine.pilot = _pilot_factory(task['max_ticks'])
+		results.append(_engine.run_round(task['max_ticks'], seed = seed))
+
+	return task['params'], results
+
+def distribution(values: list[int] | list[float]) -> DistributionDict:
+
+	deciles = statistics.quantiles(values, n = 10) if len(values) > 1 else [values[0]] * 9
+
+	return {
+		'mean': statistics.fmean(values),
+		'stdev': statistics.pstdev(values),
+		'min': min(values),
+		'p10': deciles[0],
+		'median': statistics.median(values),
+		'p90': deciles[-1],
+		'max': max(values)
+	}
+
+def init() -> None:
+
+	parser = argparse.ArgumentParser(description = 'Sweep Flappy Taco physics constants over a grid, flying headless rounds on every core.')
+	parser.add_argument('--param', type = parse_param, action = 'append', default = [], metavar = 'NAME=VALUES', help = f'values to sweep: NAME=v1,v2,... or NAME=start:stop:step; NAME is one of {", ".join(PARAMETERS)}')
+	parser.add_argument('--rounds', type = int, default = 50, help = 'rounds per grid point; every grid point flies the same seeds')
+	parser.add_argument('--seed', type = int, default = 0, help = 'seed of the first round')
+	parser.add_argument('--max-seconds', type = float, default = 120.0, help = 'simulated seconds before a round is cut off')
+	parser.add_argument('--pilot', choices = ('heuristic', 'scripted'), default = 'heuristic')
+	parser.add_argument('--jump-every', type = int, default = 30, help = 'ticks between jumps for the scripted pilot')
+	parser.add_argument('--processes', type = int, default = os.cpu_count() or 1)
+	parser.add_argument('--chunk', type = int, default = 10, help = 'rounds per task handed to a worker')
+	parser.add_argument('--output', default = 'sweep_results.json')
+	args = parser.parse_args()
+
+	names = [name for name, _ in args.param]
+	grid = [dict(zip(names, values)) for values in itertools.product(*(values for _, values in args.param))]
+	seeds = list(range(args.seed, args.seed + args.rounds))
+	max_ticks = round(args.max_seconds * main.Game.TICK_RATE)
+
+	# small independent tasks keep every worker busy until the end of the sweep
+	tasks: list[SweepTaskDict] = [
+		{'params': params, 'seeds': seeds[index:index + args.chunk], 'max_ticks': max_ticks}
+		for params in grid for index in range(0, len(seeds), args.chunk)
+	]
+
+	logger.info(f'sweeping {len(grid)} grid points x {args.rounds} rounds as {len(tasks)} tasks over {args.processes} processes')
+	print(f'{len(grid)} grid points x {args.rounds} rounds -> {len(tasks)} tasks on {args.processes} processes')
+
+	start_time = perf_counter()
+	collected: dict[str, list[headless.RoundResultDict]] = {json.dumps(params, sort_keys = True): [] for params in grid}
+
+	# no context manager: its exit would terminate() the workers. On an error or Ctrl-C the queued
+	# tasks are skipped and the workers still exit on their own
+	stopping = workers.context().Event()
+	pool = workers.context().Pool(args.processes, initializer = _init_worker, initargs = (args.pilot, args.jump_every, stopping))
+
+	try:
+
+		for done, (params, results) in enumerate(pool.imap_unordered(_run_task, tasks), start = 1):
+
+			collected[json.dumps(params, sort_keys = True)] += results
+			print(f'\r{done}/{len(tasks)} tasks', end = '', flush = True)
+
+	except BaseException:
+
+		stopping.set()
+		raise
+
+	finally:
+		workers.close_pool(pool)
+
+	elapsed = perf_counter() - start_time
+	print()
+
+	configs: list[ConfigResultDict] = []
+
+	for params in grid:
+
+		results = sorted(collected[json.dumps(params, sort_keys = True)], key = lambda result: result['seed'])
+		scores = [result['score'] for result in results]
+		survival_times = [result['survival_time'] for result in results]
+
+		configs.append({
+			'params': params,
+			'rounds': len(results),
+			'score': distribution(scores),
+			'survival_time': distribution(survival_times),
+			'death_causes': {cause: sum(result['death_cause'] == cause for result in results) for cause in sorted({result['death_cause'] for result in results})},
+			'scores': scores,
+			'survival_times': survival_times
+		})
+
+	with open(args.output, 'w') as file:
+		json.dump({'pilot': args.pilot, 'max_seconds': args.max_seconds, 'seeds': [seeds[0], seeds[-1]], 'elapsed': elapsed, 'configs': configs}, file, indent = '\t')
+
+	for config in configs:
+		print(f'{config["params"] or "defaults"}: score {round(config["score"]["mean"], 2)} (median {config["score"]["median"]}), survival {round(config["survival_time"]["mean"], 2)}s (median {round(config["survival_time"]["median"], 2)}s)')
+
+	summary = f'{len(grid) * args.rounds} rounds in {round(elapsed, 2)}s; results written to {args.output}'
+	logger.info(summary)
+	print(summary)
+
+if __name__ == '__main__': init()
@@ -0,0 +1,38 @@
+import signal
+import multiprocessing
+import multiprocessing.pool
+from multiprocessing.connection import Connection
+from multiprocessing.context import SpawnContext
+from multiprocessing.process import BaseProcess
+
+import logs
+
+logger = logs.get_logger(file = __file__) # get logger
+
+# Worker processes - every process that hosts a Game is started + stopped through here.
+# Spawn, never fork: a forked child would inherit the parent's live SDL audio + video state.
+# Never terminate() one either: SDL turns the SIGTERM into a quit event and carries on,
+# so workers are always asked to finish and then joined.
+
+def context() -> SpawnContext:
+	return multiprocessing.get_context('spawn')
+
+def ignore_interrupts() -> None:
+
+	# run first thing in every worker: Ctrl-C reaches the whole process group, but only the parent acts on it
+	signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def close_pool(pool: multiprocessing.pool.Pool) -> None:
+
+	# no more tasks; every worker exits once the queue runs dry
+	pool.close()
+	pool.join()
+	logger.info('worker pool joined')
+
+def close_processes(connections: list[Connection], processes: list[BaseProcess]) -> None:
+
+	# each worker leaves its command loop on ('close', None)
+	for connection in connections: connection.send(('close', None))
+	for process in processes: process.join()
+	for connection in connections: connection.close()
+	logger.info(f'{len(processes)} worker processes joined')
@@ -0,0 +1,169 @@
+from bisect import bisect_left, bisect_right
+from typing import Any
+
+import numpy as np
+
+class ObstacleWorld:
+
+	'''
+	Struct-of-arrays store of every obstacle column in play.
+
+	A column is one fork pair (left edge x, gap centre y) plus an optional
+	chilli centred in the gap. Columns spawn at the right
+	edge and all scroll left at the same speed, so rows are always sorted by
+	x: off-screen columns are a prefix of the arrays. Scrolling, culling,
+	scoring and chilli pickup each run as one vectorised pass over the live
+	rows [0, count); `payloads` holds whatever the game binds to each row
+	(its sprites) in the same order.
+	'''
+
+	# kind bit flags
+	FORK = 1
+	CHILLI = 2
+
+	def __init__(self, fork_size: tuple[int, int], chilli_size: tuple[int, int], chilli_offset: float, capacity: int = 16) -> None:
+
+		self.fork_width, self.fork_height = fork_size
+		self.chilli_width, self.chilli_height = chilli_size
+		self.chilli_offset = chilli_offset # chilli centre x relative to the column's left edge
+		self.extent = max(self.fork_width, chilli_offset + self.chilli_width / 2) # right edge of a column relative to x
+
+		self.count = 0
+		self.scrolled = 0.0 # distance of the last scroll
+		self.x = np.zeros(capacity, dtype = np.float64)
+		self.previous_x = np.zeros(capacity, dtype = np.float64)
+		self.y = np.zeros(capacity, dtype = np.float64)
+		self.kind = np.zeros(capacity, dtype = np.uint8)
+		self.passed = np.zeros(capacity, dtype = np.bool_)
+		self.collected = np.zeros(capacity, dtype = np.bool_)
+		self.payloads: list[Any] = []
+
+	def _columns(self) -> tuple[np.ndarray, ...]:
+		return (self.x, self.previous_x, self.y, self.kind, self.passed, self.collected)
+
+	def _grow(self) -> None:
+
+		capacity = 2 * len(self.x)
+		self.x, self.previous_x, self.y, self.kind, self.passed, self.collected = (np.resize(column, capacity) for column in self._columns())
+
+	def spawn(self, x: float, y: float, kind: int, payload: Any = None) -> int:
+
+		if self.count == len(self.x): self._grow()
+
+		index = self.count
+		self.x[index] = self.previous_x[index] = x
+		self.y[index] = y
+		self.kind[index] = kind
+		self.passed[index] = False
+		self.collected[index] = False
+		self.payloads.append(payload)
+		self.count += 1
+
+		return index
+
+	def clear(self) -> list[Any]:
+
+		payloads = self.payloads
+		self.payloads = []
+		self.count = 0
+		self.scrolled = 0.0
+		return payloads
+
+	def snapshot(self) -> np.ndarray:
+
+		# live rows as one (columns, count) float64 array - one copy, and every column's dtype round-trips exactly
+		live = self.count
+		return np.array([column[:live] for column in self._columns()], dtype = np.float64)
+
+	def restore(self, rows: np.ndarray, scrolled: float, payloads: list[Any]) -> None:
+
+		# back to a snapshot(); the caller has cleared the world and binds fresh payloads to the rows
+		live = rows.shape[1]
+		while len(self.x) < live: self._grow()
+
+		for column, row in zip(self._columns(), rows): column[:live] = row
+		self.count = live
+		self.scrolled = scrolled
+		self.payloads = payloads
+
+	def scroll(self, distance: float) -> None:
+
+		live = self.count
+		self.scrolled = distance
+		self.previous_x[:live] = self.x[:live]
+		self.x[:live] -= distance
+
+	def cull(self) -> list[Any]:
+
+		# columns fully past the left edge are always a prefix; drop them by shifting the rest down
+		live = self.count
+		if not live or self.x[0] + self.extent > 0: return []
+		gone = bisect_right(self.x, -self.extent, 0, live)
+
+		for column in self._columns(): column[:live - gone] = column[gone:live]
+
+		removed = self.payloads[:gone]
+		del self.payloads[:gone]
+		self.count -= gone
+
+		return removed
+
+	def update_passed(self, player_x: float) -> int:
+
+		# forks whose centre has reached the player; returns how many were newly passed
+		reached = bisect_right(self.x, player_x - self.fork_width / 2, 0, self.count)
+		if not reached or self.passed[reached - 1]: return 0 # passing only ever grows a prefix
+
+		passing = (self.kind[:reached] & self.FORK).astype(np.bool_) & ~self.passed[:reached]
+		self.passed[:reached] |= passing
+
+		return int(np.count_nonzero(passing))
+
+	def chilli_span(self, left: float, right: float) -> range:
+
+		# rows whose chilli spans part of [left, right) horizontally, whether or not the row has a chilli.
+		# rows are sorted by x, so they are one contiguous run; bisecting finds it in a few scalar compares,
+		# cheaper than a NumPy call for the handful of rows ever on screen
+		live = self.count
+		start = bisect_right(self.x, left - self.chilli_offset - self.chilli_width / 2, 0, live)
+		bound = right + self.chilli_width / 2 - self.chilli_offset
+		if start == live or self.x[start] >= bound: return range(0)
+
+		return range(start, bisect_left(self.x, bound, start, live))
+
+	def collect_chillies(self, player_rect: tuple[int, int, int, int]) -> np.ndarray:
+
+		# rows whose uncollected chilli rect overlaps the player's rect; marks them collected
+		left, top, width, height = player_rect
+		span = self.chilli_span(left, left + width)
+		if not span: return np.empty(0, dtype = np.intp)
+		start, end = span.start, span.stop
+
+		touching = (
+			(self.kind[start:end] & self.CHILLI).astype(np.bool_) & ~self.collected[start:end]
+			& (np.abs(self.y[start:end] - (top + height / 2)) < (self.chilli_height + height) / 2)
+		)
+		self.collected[start:end] |= touching
+
+		return np.flatnonzero(touching) + start
+
+	def overlapping(self, left: float, right: float) -> range:
+
+		# rows whose forks span part of [left, right); rows are sorted by x so they are one contiguous run
+		live = self.count
+		start = bisect_right(self.x, left - self.fork_width, 0, live)
+		if start == live or self.x[start] >= right: return range(0)
+
+		return range(start, bisect_left(self.x, right, start, live))
+
+	def next_column(self, x: float) -> int:
+
+		# index of the first column whose forks reach past x, or -1 if there is none
+		live = self.count
+		index = bisect_left(self.x, x - self.fork_width, 0, live)
+		return index if index < live else -1
+
+	def interpolated_x(self, alpha: float) -> np.ndarray:
+
+		live = self.count
+		return self.previous_x[:live] + (self.x[:live] - self.previous_x[:live]) * alpha